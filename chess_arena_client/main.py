@@ -6,24 +6,28 @@ Handles WebSocket communication, matchmaking, and game management.
 Strategy for move selection is injected as a dependency.
 """
 
-import argparse
 import asyncio
-import glob
-import importlib.util
-import json
+import atexit
 import os
+import random
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple
 
 # Type alias for websocket connection
 if TYPE_CHECKING:
     WebSocketConnection = Any
 
 import chess
+import orjson
 import websockets
 from rich.console import Console
+from rich.style import Style
+from rich.text import Text
 
 from chess_arena_client.strategy_base import StrategyBase
 
@@ -44,67 +48,170 @@ PIECE_SYMBOLS = {
 }
 USE_PIECE_SYMBOLS = False
 
+# Rich markup fragments for board_pretty_print, formatted once at import
+_BORDER_LINE = f"[{BORDER_COLOR}] +---+---+---+---+---+---+---+---+[/{BORDER_COLOR}]"
+_CELL_SEPARATOR = f"[{BORDER_COLOR}]|[/{BORDER_COLOR}]"
+_FILE_LETTERS_LINE = f"[{RANK_FILE_COLOR}]    a   b   c   d   e   f   g   h[/{RANK_FILE_COLOR}]"
+_RANK_LABELS = [f"[{RANK_FILE_COLOR}]{rank}[/{RANK_FILE_COLOR}]" for rank in range(8, 0, -1)]
+
+
+def _cell_markup(piece_char: str) -> str:
+    """
+    Build the markup for one board cell, including its trailing separator.
+
+    :param piece_char: Piece symbol from a FEN board field, or ' ' for an empty square
+    :type piece_char: str
+    :return: Rich markup for the cell
+    :rtype: str
+    """
+    if piece_char == ' ':
+        return "   " + _CELL_SEPARATOR
+    symbol = PIECE_SYMBOLS[piece_char] if USE_PIECE_SYMBOLS else piece_char
+    if piece_char.isupper():
+        style = f"{WHITE_PIECE_COLOR} on {WHITE_PIECE_COLOR_BG}"
+    else:
+        style = f"{BLACK_PIECE_COLOR} on {BLACK_PIECE_COLOR_BG}"
+    return f"[{style}] {symbol} [/{style}]" + _CELL_SEPARATOR
+
+
+# Cell markup for all 12 piece symbols plus the empty square
+_CELL_MARKUP = {piece_char: _cell_markup(piece_char) for piece_char in PIECE_SYMBOLS}
+# Expands FEN empty-square digits into one space per square
+_EXPAND_EMPTY = str.maketrans({str(n): ' ' * n for n in range(1, 9)})
+
+# Pre-parsed styles for the per-move output, so those lines skip rich's markup parser
+_MOVE_HEADER_STYLE = Style.parse("bold magenta")
+_LABEL_STYLE = Style.parse("cyan")
+_VALUE_STYLE = Style.parse("bold")
+_DIM_STYLE = Style.parse("dim")
+_CHOSEN_LABEL_STYLE = Style.parse("bold green")
+_CHOSEN_MOVE_STYLE = Style.parse("bold white")
+
+# Pre-rendered status lines printed from the connection loops; the health warnings
+# only format their elapsed time and reuse a parsed style
+_WARNING_STYLE = Style.parse("yellow")
+_ERROR_STYLE = Style.parse("red")
+_RECONNECT_MSG = Text("Reconnecting to server...", style=_DIM_STYLE)
+_EXTRA_HEALTH_CHECK_MSG = Text("Sent additional health check...", style=_DIM_STYLE)
+_CONNECTION_CLOSED_MSG = Text("✗ Connection to server closed", style=_ERROR_STYLE)
+
+# Fields of an auth file, in the order load_auth_from_file returns them
+_AUTH_FIELDS = itemgetter("game_id", "player_id", "player_color", "auth_token")
+
+# Results file counter for each game outcome
+_OUTCOME_COUNTS = {"win": "wins", "loss": "losses", "draw": "draws"}
+
+# Raw frames of a bare server ping, compact and with Python's default separators
+_PING_FRAMES = frozenset((b'{"type":"ping"}', b'{"type": "ping"}'))
+
+# WebSocket options for the game connection: the server sends small JSON frames, so
+# permessage-deflate costs more CPU than it saves, and reads are never throttled.
+# Protocol-level keepalive pings are off because the client runs its own health checks
+_WS_CONNECT_OPTIONS: Dict[str, Any] = {
+    "compression": None,
+    "max_size": 2 ** 20,
+    "max_queue": None,
+    "ping_interval": None,
+    "open_timeout": 10,
+}
+
+
+class _PlainConsole(Console):
+    """
+    Console for output that is not a terminal, writing plain text lines.
+
+    Markup tags are stripped and styles dropped without going through rich's rendering
+    pipeline, and lines are not flushed on every print; the client flushes once per move
+    and after each other game message it reports.
+    """
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", **kwargs: Any) -> None:
+        """
+        Write objects as plain text.
+
+        :param objects: Strings (rich markup allowed) or Text objects to write
+        :type objects: Any
+        :param sep: Separator between objects
+        :type sep: str
+        :param end: String written after the last object
+        :type end: str
+        """
+        parse_markup = kwargs.get("markup") is not False
+        parts = []
+        for obj in objects:
+            if isinstance(obj, Text):
+                parts.append(obj.plain)
+            elif isinstance(obj, str):
+                parts.append(Text.from_markup(obj).plain if parse_markup and "[" in obj else obj)
+            else:
+                parts.append(str(obj))
+        self.file.write(sep.join(parts) + end)
+
+
 console = Console()
 
+# Strategy modules already executed in this process, keyed by (path, mtime_ns)
+_strategy_modules: Dict[Tuple[str, int], ModuleType] = {}
+
 
 def board_pretty_print(board: chess.Board) -> None:
     """
     Print a pretty chess board with Unicode pieces and colored display.
 
+    The ranks are read from the board FEN and rendered as one markup string with a single console call.
+
     :param board: Chess board to display
     :type board: chess.Board
     """
-    board_state = []
-    for rank in range(7, -1, -1):
-        row = []
-        for file in range(8):
-            square = chess.square(file, rank)
-            piece = board.piece_at(square)
-            if piece:
-                symbol = piece.symbol()
-                row.append(symbol)
-            else:
-                row.append(' ')
-        board_state.append(row)
-
-    # Print top border
-    console.print(f"[{BORDER_COLOR}] +---+---+---+---+---+---+---+---+[/{BORDER_COLOR}]")
-
-    # Print each rank
-    for rank_idx, row in enumerate(board_state):
-        rank_number = 8 - rank_idx
-        line_parts = [f"[{RANK_FILE_COLOR}]{rank_number}[/{RANK_FILE_COLOR}]"]
-
-        for piece_char in row:
-            unicode_piece = PIECE_SYMBOLS.get(piece_char, ' ') if USE_PIECE_SYMBOLS else piece_char
-            if piece_char.isupper():
-                # White pieces
-                piece_display = (
-                    f"[{WHITE_PIECE_COLOR} on {WHITE_PIECE_COLOR_BG}] {unicode_piece} "
-                    f"[/{WHITE_PIECE_COLOR} on {WHITE_PIECE_COLOR_BG}]"
-                )
-            elif piece_char.islower():
-                # Black pieces
-                piece_display = (
-                    f"[{BLACK_PIECE_COLOR} on {BLACK_PIECE_COLOR_BG}] {unicode_piece} "
-                    f"[/{BLACK_PIECE_COLOR} on {BLACK_PIECE_COLOR_BG}]"
-                )
-            else:
-                # Empty square
-                piece_display = "   "
+    lines = [_BORDER_LINE]
+    for rank_label, rank in zip(_RANK_LABELS, board.board_fen().translate(_EXPAND_EMPTY).split('/')):
+        lines.append(rank_label + _CELL_SEPARATOR + "".join([_CELL_MARKUP[c] for c in rank]))
+        lines.append(_BORDER_LINE)
 
-            line_parts.append(f"[{BORDER_COLOR}]|[/{BORDER_COLOR}]")
-            line_parts.append(piece_display)
+    lines.append(_FILE_LETTERS_LINE)
+    console.print("\n".join(lines), highlight=False)
 
-        line_parts.append(f"[{BORDER_COLOR}]|[/{BORDER_COLOR}]")
-        console.print("".join(line_parts))
 
-        # Print horizontal border
-        console.print(f"[{BORDER_COLOR}] +---+---+---+---+---+---+---+---+[/{BORDER_COLOR}]")
+def _atomic_write_json(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write data as indented JSON, replacing the file atomically.
 
-    # Print file letters
-    file_letters = "    a   b   c   d   e   f   g   h"
-    console.print(f"[{RANK_FILE_COLOR}]{file_letters}[/{RANK_FILE_COLOR}]")
+    :param path: Path of the JSON file to write
+    :type path: str
+    :param data: JSON-serializable data
+    :type data: Dict[str, Any]
+    :raises Exception: If the file cannot be written
+    """
+    _atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file, replacing it atomically.
+
+    The data goes to a temporary file next to the target, which is synced and then renamed
+    over it, so a crash mid-write never leaves a truncated file behind.
+
+    :param path: Path of the file to write
+    :type path: str
+    :param data: File contents
+    :type data: bytes
+    :raises Exception: If the file cannot be written
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave the partial temporary file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def load_auth_from_file(file_path: str) -> Optional[Tuple[str, str, str, str]]:
@@ -117,17 +224,16 @@ def load_auth_from_file(file_path: str) -> Optional[Tuple[str, str, str, str]]:
     :rtype: Optional[Tuple[str, str, str, str]]
     """
     try:
-        with open(file_path, 'r') as f:
-            auth_data = json.load(f)
-
-        game_id = auth_data.get("game_id")
-        player_id = auth_data.get("player_id")
-        player_color = auth_data.get("player_color")
-        auth_token = auth_data.get("auth_token")
+        auth_data = orjson.loads(Path(file_path).read_bytes())
 
-        if not all([game_id, player_id, player_color, auth_token]):
+        try:
+            auth_fields = _AUTH_FIELDS(auth_data)
+        except KeyError:
+            auth_fields = None
+        if not auth_fields or not all(auth_fields):
             console.print(f"[red]Error: Missing required fields in {file_path}[/red]")
             return None
+        game_id, player_id, player_color, auth_token = auth_fields
 
         console.print(f"[cyan]Loaded auth token for player:[/cyan] {player_id}")
         console.print(f"[cyan]Game ID:[/cyan] {game_id}")
@@ -137,7 +243,7 @@ def load_auth_from_file(file_path: str) -> Optional[Tuple[str, str, str, str]]:
     except FileNotFoundError:
         console.print(f"[red]Error: Auth file not found: {file_path}[/red]")
         return None
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         console.print(f"[red]Error: Invalid JSON in auth file: {file_path}[/red]")
         return None
     except Exception as e:
@@ -152,36 +258,32 @@ def get_latest_auth() -> Optional[Tuple[str, str, str, str]]:
     :return: Tuple of (game_id, player_id, player_color, auth_token) if found, None otherwise
     :rtype: Optional[Tuple[str, str, str, str]]
     """
-    auth_files = glob.glob(".*_auth")
-    if not auth_files:
+    # Track the newest auth file by modification time in one pass over the directory;
+    # DirEntry.stat() reuses data from the directory scan where the platform provides it
+    latest_file = None
+    latest_mtime = -1
+    with os.scandir('.') as entries:
+        for entry in entries:
+            # Filename format: .{player_id}_{game_id}_{color}_{auth_token}_auth
+            name = entry.name
+            if name[:1] != '.' or name[-5:] != '_auth' or name.count('_') < 4:
+                continue
+            try:
+                mtime = entry.stat().st_mtime_ns
+            except OSError:
+                # Removed while we were scanning
+                continue
+            if mtime > latest_mtime:
+                latest_mtime, latest_file = mtime, name
+    if latest_file is None:
         return None
 
-    # Sort by modification time, newest first
-    auth_files.sort(key=os.path.getmtime, reverse=True)
-    latest_file = auth_files[0]
-
-    try:
-        # Parse filename: .{player_id}_{game_id}_{color}_{auth_token}_auth
-        filename = Path(latest_file).name
-        if not filename.startswith('.') or not filename.endswith('_auth'):
-            return None
-
-        # Remove leading '.' and trailing '_auth'
-        content = filename[1:-5]
-        parts = content.split('_', 3)
-
-        if len(parts) != 4:
-            return None
-
-        player_id, game_id, player_color, auth_token = parts
-        console.print(f"[cyan]Found auth token for player:[/cyan] {player_id}")
-        console.print(f"[cyan]Game ID:[/cyan] {game_id}")
-        console.print(f"[cyan]Color:[/cyan] {player_color}")
-        return game_id, player_id, player_color, auth_token
-
-    except Exception as e:
-        console.print(f"[red]Error reading auth file:[/red] {e}")
-        return None
+    # Remove leading '.' and trailing '_auth'
+    player_id, game_id, player_color, auth_token = latest_file[1:-5].split('_', 3)
+    console.print(f"[cyan]Found auth token for player:[/cyan] {player_id}")
+    console.print(f"[cyan]Game ID:[/cyan] {game_id}")
+    console.print(f"[cyan]Color:[/cyan] {player_color}")
+    return game_id, player_id, player_color, auth_token
 
 
 class ChessClient:
@@ -209,17 +311,21 @@ class ChessClient:
     _receive_task: Optional[asyncio.Task]
     _heartbeat_task: Optional[asyncio.Task]
     _health_monitor_task: Optional[asyncio.Task]
+    _send_task: Optional[asyncio.Task]
 
     def __init__(self, server_url: str, strategy: StrategyBase, continue_game: bool = False,
                  auth_file: Optional[str] = None, max_reconnect_attempts: int = 5,
                  reconnect_delay: float = 5.0, timeout: Optional[float] = None,
-                 store_result_file: Optional[str] = None, aggressive_reconnect: bool = False):
+                 store_result_file: Optional[str] = None, aggressive_reconnect: bool = False,
+                 tt_file: Optional[str] = None, quiet: bool = False, results_batch_size: int = 1):
         self.server_url = server_url.replace('http://', 'ws://').replace('https://', 'wss://')
         self.strategy = strategy
         self.continue_game = continue_game
         self.auth_file = auth_file
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
+        # Exponential backoff schedule; attempts past the end reuse the last (longest) delay
+        self._backoff = tuple(reconnect_delay * (1 << i) for i in range(min(max_reconnect_attempts, 20) + 1))
         self.timeout = timeout
         self.game_id: Optional[str] = None
         self.player_id: Optional[str] = None
@@ -228,115 +334,205 @@ class ChessClient:
         self.local_board = chess.Board()
         self.websocket: Optional['WebSocketConnection'] = None
         self.message_queue: asyncio.Queue = asyncio.Queue()
+        # Futures resolved directly by receive_messages, keyed by message type
+        self._waiters: Dict[str, asyncio.Future] = {}
         self.store_result_file: Optional[str] = store_result_file
+        # Parsed results file, loaded on first use and kept in sync with what we save
+        self._results_cache: Optional[Dict[str, Any]] = None
+        # Game IDs already recorded in the results, for constant-time duplicate checks
+        self._game_ids: Set[str] = set()
+        # Results are written once this many updates are pending, and at exit
+        self.results_batch_size = max(1, results_batch_size)
+        self._unsaved_results = 0
+        # Count increments and new game IDs since the last save, added to the file's
+        # current contents when saving
+        self._unsaved_counts: Dict[str, int] = {}
+        self._unsaved_game_ids: List[str] = []
+        self._flush_at_exit = False
+        # (player_id, game_id, player_color, auth_token) last written to the auth file
+        self._auth_persisted: Optional[Tuple[Optional[str], ...]] = None
         self.aggressive_reconnect = aggressive_reconnect
+        # File the strategy's transposition table is restored from and saved to between games
+        self.tt_file: Optional[str] = tt_file
+        # Print one line per move and no board diagrams
+        self.quiet = quiet
 
         # Task attributes
         self._receive_task: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._health_monitor_task: Optional[asyncio.Task] = None
+        self._send_task: Optional[asyncio.Task] = None
+
+        # Outgoing frames waiting to be written by the send task
+        self._pending_send: List[bytes] = []
+        self._send_event = asyncio.Event()
+
+        # Single worker thread for strategy calls, so a long search never blocks the
+        # event loop and the strategy always runs on the same thread
+        self._strategy_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="strategy")
+
+        # Handlers for in-game server messages; each returns True when the game is over
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[bool]]] = {
+            "move_made": self._on_move_made,
+            "opponent_disconnected": self._on_opponent_disconnected,
+            "game_over": self._on_game_over,
+            "error": self._on_error,
+        }
+        # Game loop state shared by the handlers
+        self._move_count = 0
+        self._show_board = False
 
         # Move timing tracking
         self.last_move_time: float = 0.0
         self.move_exceeded_time_limit: bool = False
 
         # Health check attributes
-        self.last_heartbeat_response = time.time()
+        self.last_heartbeat_response = time.monotonic()
         self.heartbeat_interval = 30  # seconds
         self.heartbeat_timeout = 60   # seconds
         self.health_check_enabled = True
+        # How long to wait for the reply to a board sync request
+        self.sync_timeout = 10.0  # seconds
 
-    async def reconnect_and_sync(self, reconnect_attempt: int = 0) -> bool:
+    def _start_bg_tasks(self) -> None:
+        """
+        Start the background tasks that serve the current WebSocket connection.
         """
-        Reconnect to the WebSocket and sync board state.
+        # Start background task to write outgoing messages
+        self._send_task = asyncio.create_task(self.flush_outgoing_messages())
 
-        :param reconnect_attempt: Current reconnection attempt number
-        :type reconnect_attempt: int
-        :return: True if it's our turn after syncing, False otherwise
-        :rtype: bool
-        :raises Exception: If reconnection fails after max attempts
+        # Start background task to receive messages
+        self._receive_task = asyncio.create_task(self.receive_messages())
+
+        # Start heartbeat task for connection health
+        self._heartbeat_task = asyncio.create_task(self.send_heartbeat())
+
+        # Start connection health monitoring task
+        self._health_monitor_task = asyncio.create_task(self.monitor_connection_health())
+
+    async def _cancel_bg_tasks(self) -> None:
         """
-        try:
-            # Close existing websocket if it exists
-            if self.websocket:
-                await self.websocket.close()
+        Cancel any background tasks that are still running and wait for them to finish.
+        """
+        tasks = [task for task in (self._receive_task, self._heartbeat_task, self._health_monitor_task,
+                                   self._send_task)
+                 if task is not None and not task.done()]
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellations to land so no task outlives its connection
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _connect(self) -> 'WebSocketConnection':
+        """
+        Open a connection to the server and start the background tasks that serve it.
 
-            # Reset health check attributes
-            self.last_heartbeat_response = time.time()
-            self.health_check_enabled = True
-
-            # Reconnect to WebSocket
-            console.print("[dim]Reconnecting to server...[/dim]")
-            async with websockets.connect(self.server_url + "/ws") as websocket:
-                self.websocket = websocket
-
-                # Restart background tasks
-                # Cancel existing tasks first
-                if self._receive_task is not None and not self._receive_task.done():
-                    self._receive_task.cancel()
-                if self._heartbeat_task is not None and not self._heartbeat_task.done():
-                    self._heartbeat_task.cancel()
-                if self._health_monitor_task is not None and not self._health_monitor_task.done():
-                    self._health_monitor_task.cancel()
-
-                # Start new background tasks
-                self._receive_task = asyncio.create_task(self.receive_messages())
-                self._heartbeat_task = asyncio.create_task(self.send_heartbeat())
-                self._health_monitor_task = asyncio.create_task(self.monitor_connection_health())
+        :return: The new WebSocket connection, also stored on self.websocket
+        :rtype: WebSocketConnection
+        :raises Exception: If the connection cannot be opened
+        """
+        self.websocket = websocket = await websockets.connect(self.server_url + "/ws", **_WS_CONNECT_OPTIONS)
+        # Frames left unsent on an earlier connection belong to that session; the new one
+        # resynchronizes from the server instead
+        self._pending_send = []
+        self._send_event.clear()
+        self._start_bg_tasks()
+        return websocket
+
+    async def reconnect(self) -> None:
+        """
+        Replace the WebSocket connection and restart the background tasks on it.
 
-                # Sync board state
-                return await self.sync_board_state(reconnect_attempt)
+        :raises Exception: If the new connection cannot be opened
+        """
+        # Stop the old tasks first so the old receive loop does not report the close below
+        await self._cancel_bg_tasks()
 
-        except Exception as e:
-            if reconnect_attempt < self.max_reconnect_attempts:
-                console.print(f"[yellow]⚠ Reconnection failed:[/yellow] {str(e)}")
-                console.print(f"[yellow]Attempt {reconnect_attempt + 1}/{self.max_reconnect_attempts}...[/yellow]")
-                # Exponential backoff with jitter to prevent thundering herd
-                import random
-                jitter = random.uniform(0, self.reconnect_delay * 0.1)  # 10% jitter
-                delay = self.reconnect_delay * (2 ** reconnect_attempt) + jitter
-                console.print(f"[dim]Waiting {delay:.1f}s before next attempt...[/dim]")
-                await asyncio.sleep(delay)
-                # Try again
-                return await self.reconnect_and_sync(reconnect_attempt + 1)
-            else:
-                # Even after max attempts, keep trying indefinitely for critical
-                # operations if aggressive reconnect is enabled
-                if self.aggressive_reconnect:
-                    console.print(
-                        f"[red]✗ Reconnection failed after {self.max_reconnect_attempts} attempts: {str(e)}[/red]")
-                    console.print(
-                        "[yellow]⚠ Continuing with infinite retry for critical "
-                        "operations (aggressive mode)...[/yellow]")
-                    # Wait longer but keep trying indefinitely
-                    import random
-                    jitter = random.uniform(0, self.reconnect_delay * 0.1)  # 10% jitter
-                    delay = self.reconnect_delay * (2 ** (self.max_reconnect_attempts - 1)) + jitter
-                    console.print(f"[dim]Waiting {delay:.1f}s before next attempt (infinite retry)...[/dim]")
-                    await asyncio.sleep(delay)
-                    # Try again with reset attempt counter to avoid overflow
-                    return await self.reconnect_and_sync(0)
-                else:
-                    raise Exception(f"Reconnection failed after {self.max_reconnect_attempts} attempts: {str(e)}")
+        # Close existing websocket if it exists
+        if self.websocket:
+            await self.websocket.close()
+
+        # Reset health check attributes
+        self.last_heartbeat_response = time.monotonic()
+        self.health_check_enabled = True
+
+        # Reconnect to WebSocket; the connection stays open for the rest of the game
+        console.print(_RECONNECT_MSG)
+        await self._connect()
 
     async def send_message(self, message: Dict[str, Any]) -> None:
         """
-        Send a message via WebSocket.
+        Queue a message for sending via WebSocket.
+
+        The frame is serialized immediately and written by the background send task.
 
         :param message: Message dictionary to send
         :type message: Dict[str, Any]
         """
         if self.websocket:
-            await self.websocket.send(json.dumps(message))
+            self._pending_send.append(orjson.dumps(message))
+            self._send_event.set()
+
+    async def flush_outgoing_messages(self) -> None:
+        """
+        Background task that writes queued frames to the WebSocket.
+
+        Frames queued while a write is in progress are drained together on the next wake-up.
+        """
+        while self.websocket:
+            await self._send_event.wait()
+            self._send_event.clear()
+            batch, self._pending_send = self._pending_send, []
+            try:
+                for frame in batch:
+                    # orjson emits UTF-8 bytes; send them as a text frame without a decode/encode round trip
+                    await self.websocket.send(frame, text=True)
+            except websockets.exceptions.ConnectionClosed:
+                break
+            except Exception as e:
+                # Later frames would queue up with nothing left to send them; close the
+                # connection so the receive loop reports it and the game loop stops waiting
+                console.print(f"[red]✗ Failed to send message:[/red] {e}")
+                await self.websocket.close()
+                break
+
+    def _expect_message(self, *message_types: str) -> asyncio.Future:
+        """
+        Register a future resolved with the next received message of any of the given types.
+
+        Matching messages are delivered to the future instead of the message queue.
+
+        :param message_types: Message types to wait for
+        :type message_types: str
+        :return: Future resolved with the message dictionary
+        :rtype: asyncio.Future
+        """
+        future = asyncio.get_running_loop().create_future()
+        for message_type in message_types:
+            self._waiters[message_type] = future
+
+        def unregister(done: asyncio.Future) -> None:
+            for message_type in message_types:
+                if self._waiters.get(message_type) is done:
+                    del self._waiters[message_type]
+
+        future.add_done_callback(unregister)
+        return future
 
     async def send_heartbeat(self) -> None:
         """
         Send periodic heartbeat messages to maintain connection health.
+
+        Heartbeats follow a fixed schedule on the event loop's monotonic clock, so a late
+        wake-up does not push every later heartbeat back.
         """
+        loop = asyncio.get_running_loop()
+        interval = self.heartbeat_interval
+        deadline = loop.time()
         while self.websocket and self.health_check_enabled:
             try:
                 await self.send_message({"type": "health_check"})
-                await asyncio.sleep(self.heartbeat_interval)
+                deadline += interval
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
             except Exception:
                 break
 
@@ -348,31 +544,33 @@ class ChessClient:
         consecutive_timeouts = 0
         max_consecutive_timeouts = 3  # Allow some grace period before forcing reconnection
 
+        # Warning threshold - warn user before actual timeout
+        heartbeat_timeout = self.heartbeat_timeout
+        warning_threshold = heartbeat_timeout * 0.7  # 70% of timeout period
+        # Monotonic clock, so wall-clock adjustments cannot fake a timeout
+        monotonic = time.monotonic
+
         while self.websocket and self.health_check_enabled:
             try:
-                current_time = time.time()
-                time_since_last_heartbeat = current_time - self.last_heartbeat_response
-
-                # Warning threshold - warn user before actual timeout
-                warning_threshold = self.heartbeat_timeout * 0.7  # 70% of timeout period
+                time_since_last_heartbeat = monotonic() - self.last_heartbeat_response
 
                 if time_since_last_heartbeat > warning_threshold:
                     consecutive_timeouts += 1
                     if consecutive_timeouts == 1:
-                        console.print(
-                            f"[yellow]⚠ Connection health warning - no response for health check "
-                            f"({time_since_last_heartbeat:.1f}s)[/yellow]")
+                        console.print(Text(
+                            "⚠ Connection health warning - no response for health check "
+                            f"({time_since_last_heartbeat:.1f}s)", style=_WARNING_STYLE))
                     elif consecutive_timeouts <= max_consecutive_timeouts:
-                        console.print(
-                            f"[yellow]⚠ Still waiting for server response "
-                            f"({time_since_last_heartbeat:.1f}s elapsed)[/yellow]")
+                        console.print(Text(
+                            "⚠ Still waiting for server response "
+                            f"({time_since_last_heartbeat:.1f}s elapsed)", style=_WARNING_STYLE))
 
                     # Force reconnection after multiple consecutive timeouts
-                    if time_since_last_heartbeat > self.heartbeat_timeout:
+                    if time_since_last_heartbeat > heartbeat_timeout:
                         if consecutive_timeouts >= max_consecutive_timeouts:
-                            console.print(
-                                f"[red]✗ Server connection timeout - no response for health check "
-                                f"({time_since_last_heartbeat:.1f}s)[/red]")
+                            console.print(Text(
+                                "✗ Server connection timeout - no response for health check "
+                                f"({time_since_last_heartbeat:.1f}s)", style=_ERROR_STYLE))
                             # Disable health checks to prevent further messages
                             self.health_check_enabled = False
                             # Close the websocket to trigger reconnection
@@ -383,7 +581,7 @@ class ChessClient:
                             # Send additional health check to try to wake up the connection
                             try:
                                 await self.send_message({"type": "health_check"})
-                                console.print("[dim]Sent additional health check...[/dim]")
+                                console.print(_EXTRA_HEALTH_CHECK_MSG)
                             except Exception:
                                 pass  # Ignore send errors
                 else:
@@ -403,32 +601,70 @@ class ChessClient:
         if not self.websocket:
             return
 
+        recv = self.websocket.recv
+        # The queue is unbounded, so putting never has to wait
+        put = self.message_queue.put_nowait
+        waiters = self._waiters
+        monotonic = time.monotonic
         try:
-            async for message in self.websocket:
-                data = json.loads(message)
+            while True:
+                # Take the raw frame bytes: orjson parses them directly, so the
+                # UTF-8 decode websockets would otherwise do on text frames is skipped
+                message = await recv(decode=False)
+                # Any message from the server counts as a heartbeat
+                self.last_heartbeat_response = monotonic()
+
+                # Plain heartbeat pings are recognised without parsing the JSON
+                if message in _PING_FRAMES:
+                    msg_type = "ping"
+                else:
+                    data = orjson.loads(message)
+                    msg_type = data.get("type")
 
                 # Handle server-initiated ping messages
-                if data.get("type") == "ping":
+                if msg_type == "ping":
                     # Respond immediately with pong
                     await self.send_message({"type": "pong"})
-                    # Update heartbeat timestamp
-                    self.last_heartbeat_response = time.time()
                     continue
 
-                # Update heartbeat timestamp for any message
-                self.last_heartbeat_response = time.time()
+                # Deliver replies straight to a waiting coroutine, if any
+                waiter = waiters.get(msg_type)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(data)
+                    continue
 
-                await self.message_queue.put(data)
+                # Queue the type alongside the payload so consumers dispatch without another lookup
+                put((msg_type, data))
+        except websockets.exceptions.ConnectionClosedOK:
+            # Normal closure ends the loop quietly
+            pass
         except websockets.exceptions.ConnectionClosed:
-            console.print("[red]✗ Connection to server closed[/red]")
+            console.print(_CONNECTION_CLOSED_MSG)
 
-    def save_auth_token(self) -> None:
+        # No more messages will arrive on this connection: fail any pending replies
+        # and wake whoever is reading the queue
+        for waiter in list(waiters.values()):
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("Connection to server closed"))
+        put((None, None))
+
+    async def save_auth_token(self) -> None:
         """
         Save auth token to file for reconnection.
 
-        :raises Exception: If save fails
+        The file is written in a worker thread so a slow disk does not stall
+        WebSocket I/O on the event loop, and skipped if these credentials are already saved.
+        """
+        if (self.player_id, self.game_id, self.player_color, self.auth_token) == self._auth_persisted:
+            return
+        await asyncio.to_thread(self._write_auth_file)
+
+    def _write_auth_file(self) -> None:
         """
-        if not all([self.player_id, self.game_id, self.player_color, self.auth_token]):
+        Write the auth token file (blocking; see save_auth_token).
+        """
+        auth = (self.player_id, self.game_id, self.player_color, self.auth_token)
+        if not all(auth):
             return
 
         if self.auth_file:
@@ -440,8 +676,8 @@ class ChessClient:
                 "auth_token": self.auth_token
             }
             try:
-                with open(self.auth_file, 'w') as f:
-                    json.dump(auth_data, f, indent=2)
+                _atomic_write_json(self.auth_file, auth_data)
+                self._auth_persisted = auth
                 console.print(f"[green]✓[/green] Auth token saved to {self.auth_file}")
             except Exception as e:
                 console.print(f"[yellow]⚠ Failed to save auth token:[/yellow] {e}")
@@ -450,33 +686,63 @@ class ChessClient:
             filename = f".{self.player_id}_{self.game_id}_{self.player_color}_{self.auth_token}_auth"
             try:
                 Path(filename).touch()
+                self._auth_persisted = auth
                 console.print(f"[green]✓[/green] Auth token saved to {filename}")
             except Exception as e:
                 console.print(f"[yellow]⚠ Failed to save auth token:[/yellow] {e}")
 
-    def load_game_results(self) -> Dict[str, Any]:
+    def _read_game_results(self, path: str) -> Dict[str, Any]:
         """
-        Load game results from file.
+        Read and parse the results file, bypassing the in-memory copy.
 
-        :return: Game results dictionary
+        :param path: Path of the results file
+        :type path: str
+        :return: Game results dictionary, empty if the file is missing or unreadable
         :rtype: Dict[str, Any]
         """
-        if not self.store_result_file:
-            return {}
-
         try:
-            with open(self.store_result_file, 'r') as f:
-                return json.load(f)
+            results = orjson.loads(Path(path).read_bytes())
         except FileNotFoundError:
             # File doesn't exist yet, return empty dict
             return {}
-        except json.JSONDecodeError:
-            console.print(f"[yellow]⚠ Invalid JSON in results file: {self.store_result_file}[/yellow]")
+        except orjson.JSONDecodeError:
+            console.print(f"[yellow]⚠ Invalid JSON in results file: {path}[/yellow]")
             return {}
         except Exception as e:
             console.print(f"[yellow]⚠ Failed to load game results:[/yellow] {e}")
             return {}
 
+        if results:
+            # Keep the recorded order but drop any duplicates a crashed run may have left
+            results["game_ids"] = list(dict.fromkeys(results.get("game_ids", [])))
+        return results
+
+    def load_game_results(self) -> Dict[str, Any]:
+        """
+        Load game results from file.
+
+        The file is read once; later calls are answered from memory, which this client
+        keeps up to date (including updates not yet written out) and refreshes from the
+        file whenever it saves. Each call returns a copy, so changing it has no effect
+        on what is saved.
+
+        :return: Game results dictionary
+        :rtype: Dict[str, Any]
+        """
+        if not self.store_result_file:
+            return {}
+
+        if self._results_cache is None:
+            results = self._read_game_results(self.store_result_file)
+            if not results:
+                return {}
+            self._game_ids = set(results["game_ids"])
+            self._results_cache = results
+
+        results = dict(self._results_cache)
+        results["game_ids"] = list(results["game_ids"])
+        return results
+
     def save_game_results(self, results: Dict[str, Any]) -> None:
         """
         Save game results to file.
@@ -489,8 +755,7 @@ class ChessClient:
             return
 
         try:
-            with open(self.store_result_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            _atomic_write_json(self.store_result_file, results)
             console.print(f"[green]✓[/green] Game results saved to {self.store_result_file}")
         except Exception as e:
             console.print(f"[yellow]⚠ Failed to save game results:[/yellow] {e}")
@@ -507,11 +772,13 @@ class ChessClient:
         if not self.store_result_file or not self.game_id:
             return
 
-        # Load existing results
-        results = self.load_game_results()
+        # Existing results are read once; later updates reuse the in-memory copy
+        if self._results_cache is None:
+            self.load_game_results()
+        results = self._results_cache
 
         # Initialize if empty
-        if not results:
+        if results is None:
             results = {
                 "wins": 0,
                 "losses": 0,
@@ -519,96 +786,441 @@ class ChessClient:
                 "timeouts": 0,
                 "game_ids": []
             }
+            self._game_ids = set()
+            self._results_cache = results
 
-        # Update counts based on outcome
-        if game_outcome == "win":
-            results["wins"] = results.get("wins", 0) + 1
-        elif game_outcome == "loss":
-            results["losses"] = results.get("losses", 0) + 1
-        elif game_outcome == "draw":
-            results["draws"] = results.get("draws", 0) + 1
+        # Update counts based on outcome, remembering the change for the next save
+        changed = []
+        if game_outcome in _OUTCOME_COUNTS:
+            changed.append(_OUTCOME_COUNTS[game_outcome])
 
         # Track timeouts
         if timeout_occurred:
-            results["timeouts"] = results.get("timeouts", 0) + 1
+            changed.append("timeouts")
 
-        # Add game ID to list if not already present
-        if "game_ids" not in results:
-            results["game_ids"] = []
+        unsaved_counts = self._unsaved_counts
+        for key in changed:
+            results[key] = results.get(key, 0) + 1
+            unsaved_counts[key] = unsaved_counts.get(key, 0) + 1
 
-        if self.game_id not in results["game_ids"]:
+        # Add game ID to list if not already present
+        if self.game_id not in self._game_ids:
+            self._game_ids.add(self.game_id)
             results["game_ids"].append(self.game_id)
+            self._unsaved_game_ids.append(self.game_id)
+
+        # Save updated results, once enough updates have accumulated
+        self._unsaved_results += 1
+        if self._unsaved_results >= self.results_batch_size:
+            self.flush_results()
+        elif not self._flush_at_exit:
+            atexit.register(self.flush_results)
+            self._flush_at_exit = True
+
+    def flush_results(self) -> None:
+        """
+        Write game results updates that are still pending to the results file.
+
+        The file is read again first and the pending updates are added to what it holds,
+        so results saved in the meantime by another client sharing the file are kept.
+        """
+        if self._unsaved_results and self.store_result_file:
+            results = (self._read_game_results(self.store_result_file)
+                       or {"wins": 0, "losses": 0, "draws": 0, "timeouts": 0})
+            for key, count in self._unsaved_counts.items():
+                results[key] = results.get(key, 0) + count
+            game_ids = dict.fromkeys(results.get("game_ids", []))
+            game_ids.update(dict.fromkeys(self._unsaved_game_ids))
+            results["game_ids"] = list(game_ids)
+
+            self.save_game_results(results)
+            self._game_ids = set(game_ids)
+            self._results_cache = results
+        self._unsaved_counts = {}
+        self._unsaved_game_ids = []
+        self._unsaved_results = 0
+
+    def _prepare_strategy(self) -> None:
+        """
+        Restore the saved transposition table, if any, and warm the strategy up.
+
+        Runs in the strategy thread.
+        """
+        if self.tt_file:
+            try:
+                data = Path(self.tt_file).read_bytes()
+            except FileNotFoundError:
+                pass
+            else:
+                self.strategy.set_transposition_table(data)
+        self.strategy.warmup()
 
-        # Save updated results
-        self.save_game_results(results)
+    def _save_transposition_table(self) -> None:
+        """
+        Save the strategy's transposition table to the configured file.
 
-    async def sync_board_state(self, reconnect_attempt: int = 0) -> bool:
+        Runs in the strategy thread, so the table is not modified while it is serialized.
         """
-        Request and sync current board state from server.
+        if not self.tt_file:
+            return
+        data = self.strategy.get_transposition_table()
+        if data is None:
+            return
+        try:
+            _atomic_write_bytes(self.tt_file, data)
+        except Exception as e:
+            console.print(f"[yellow]⚠ Failed to save transposition table: {e}[/yellow]")
+
+    async def _request_board_state(self) -> bool:
+        """
+        Ask the server for the board once and load it into the local board.
 
-        :param reconnect_attempt: Current reconnection attempt number (for backoff calculation)
-        :type reconnect_attempt: int
         :return: True if it's our turn after syncing, False otherwise
         :rtype: bool
-        :raises Exception: If sync fails after max reconnection attempts
+        :raises Exception: If the server replies with an error
         """
+        # Register for the reply before sending so it cannot be missed
+        reply = self._expect_message("board_state", "error")
+        await self.send_message({
+            "type": "get_board",
+            "game_id": self.game_id,
+            "player_id": self.player_id,
+            "auth_token": self.auth_token
+        })
+
+        # Wait for board_state response; a lost reply counts as a failed sync rather than a hang
         try:
-            await self.send_message({
-                "type": "get_board",
-                "game_id": self.game_id,
-                "player_id": self.player_id,
-                "auth_token": self.auth_token
-            })
+            msg = await asyncio.wait_for(reply, timeout=self.sync_timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"No board state received within {self.sync_timeout:.0f}s")
+        if msg.get("type") != "board_state":
+            raise Exception(f"Board sync error: {msg.get('message', 'Unknown error')}")
+
+        fen = msg.get("fen")
+        if fen:
+            self.local_board.set_fen(fen)
+        # Check if it's our turn
+        return msg.get("current_turn") == self.player_color
+
+    async def sync_board_state(self) -> bool:
+        """
+        Request and sync current board state from server, reconnecting with exponential backoff on failure.
 
-            # Wait for board_state response
-            while True:
-                msg = await self.message_queue.get()
-                if msg.get("type") == "board_state":
-                    fen = msg.get("fen")
-                    if fen:
-                        self.local_board.set_fen(fen)
-                    current_turn = msg.get("current_turn")
-                    # Check if it's our turn
-                    is_our_turn = current_turn == self.player_color
-                    return is_our_turn
-                elif msg.get("type") == "error":
-                    error_message = msg.get('message', 'Unknown error')
-                    # Check if this is a game cancellation error that might be recoverable
-                    if "Game cancelled" in error_message and "not responding" in error_message:
-                        if reconnect_attempt < self.max_reconnect_attempts:
-                            console.print(f"[yellow]⚠ Game sync error:[/yellow] {error_message}")
-                            console.print(
-                                f"[yellow]Attempt {reconnect_attempt + 1}/"
-                                f"{self.max_reconnect_attempts} to reconnect...[/yellow]")
-                            # Exponential backoff
-                            delay = self.reconnect_delay * (2 ** reconnect_attempt)
-                            console.print(f"[dim]Waiting {delay:.1f}s before reconnect attempt...[/dim]")
-                            await asyncio.sleep(delay)
-                            # Try to reconnect
-                            return await self.reconnect_and_sync(reconnect_attempt + 1)
-                        else:
-                            raise Exception(
-                                f"Board sync error after {self.max_reconnect_attempts} attempts: {error_message}")
-                    else:
-                        # For other errors, don't attempt reconnection
-                        raise Exception(f"Board sync error: {error_message}")
-                await self.message_queue.put(msg)  # Put back if not for us
-                await asyncio.sleep(0.01)
-        except Exception as e:
-            # If we get a connection error during sync, try to reconnect
-            if reconnect_attempt < self.max_reconnect_attempts:
-                console.print(f"[yellow]⚠ Connection error during sync:[/yellow] {str(e)}")
-                console.print(
-                    f"[yellow]Attempt {reconnect_attempt + 1}/{self.max_reconnect_attempts} to reconnect...[/yellow]")
-                # Exponential backoff
-                delay = self.reconnect_delay * (2 ** reconnect_attempt)
+        Retries up to max_reconnect_attempts times, or indefinitely with aggressive_reconnect.
+
+        :return: True if it's our turn after syncing, False otherwise
+        :rtype: bool
+        :raises Exception: If sync fails after max reconnection attempts
+        """
+        attempt = 0
+        while True:
+            try:
+                if attempt:
+                    await self.reconnect()
+                return await self._request_board_state()
+            except Exception as e:
+                if attempt >= self.max_reconnect_attempts and not self.aggressive_reconnect:
+                    raise Exception(f"Board sync failed after {self.max_reconnect_attempts} attempts: {str(e)}")
+
+                console.print(f"[yellow]⚠ Board sync failed:[/yellow] {str(e)}")
+                if attempt < self.max_reconnect_attempts:
+                    console.print(
+                        f"[yellow]Attempt {attempt + 1}/{self.max_reconnect_attempts} to reconnect...[/yellow]")
+                else:
+                    console.print("[yellow]⚠ Continuing with infinite retry (aggressive mode)...[/yellow]")
+
+                # Exponential backoff with jitter to prevent thundering herd
+                backoff = self._backoff
+                jitter = random.uniform(0, self.reconnect_delay * 0.1)  # 10% jitter
+                delay = backoff[min(attempt, len(backoff) - 1)] + jitter
                 console.print(f"[dim]Waiting {delay:.1f}s before reconnect attempt...[/dim]")
                 await asyncio.sleep(delay)
-                # Try to reconnect
-                return await self.reconnect_and_sync(reconnect_attempt + 1)
+                attempt += 1
+
+    async def _play_one_move(self, move_count: int, show_board: bool = False) -> int:
+        """
+        Choose a move for the current position with the strategy and send it to the server.
+
+        The search starts before anything is printed, so console output overlaps the search
+        instead of delaying it.
+
+        :param move_count: Number of moves this client has made so far
+        :type move_count: int
+        :param show_board: Whether to draw the board while the search runs
+        :type show_board: bool
+        :return: Updated move count
+        :rtype: int
+        """
+        board = self.local_board
+        strategy = self.strategy
+        search_time = strategy.search_time
+        # Ensure player_color is not None (should be set after connecting to a game)
+        player_color = self.player_color or "white"  # fallback to "white" if somehow None
+
+        # Generate the legal moves once and derive every notation from this list; the
+        # strategy gets the same list, so it must not mutate it
+        moves = list(board.legal_moves)
+        if not moves:
+            console.print("[bold red]No legal moves - game over[/bold red]")
+            return move_count
+
+        notation = strategy.move_notation
+        legal_moves: List[Any]
+        if notation == "move":
+            # The strategy takes chess.Move objects; preview them as UCI, which needs no
+            # disambiguation scan, so only the chosen move is ever converted to SAN
+            legal_moves = moves
+            preview = [m.uci() for m in moves[:10]]
+        else:
+            if notation == "uci":
+                legal_moves = [m.uci() for m in moves]
+            else:
+                legal_moves = [board.san(m) for m in moves]
+            preview = legal_moves[:10]
+
+        # Search in the strategy thread on a copy of the board, so heartbeats and incoming
+        # messages keep flowing while it thinks
+        loop = asyncio.get_running_loop()
+        move_start = time.perf_counter()
+        search = loop.run_in_executor(
+            self._strategy_executor, strategy.choose_move, board.copy(), legal_moves, player_color)
+
+        if show_board:
+            console.print()
+            board_pretty_print(board)
+        if not self.quiet:
+            header = f"━━━ Move {move_count + 1} ({player_color}) ━━━"
+            console.print(Text.assemble("\n", (header, _MOVE_HEADER_STYLE)))
+            console.print(Text.assemble(("Game ID:", _LABEL_STYLE), " ", (f"{self.game_id}", _VALUE_STYLE)))
+            console.print(Text.assemble(("Client:", _LABEL_STYLE), " ", (f"{self.player_id}", _VALUE_STYLE)))
+            console.print(Text.assemble((f"Legal moves ({len(legal_moves)}):", _DIM_STYLE),
+                                        f" {', '.join(preview)}..."))
+
+        chosen_move: Any = await search
+        move_time = time.perf_counter() - move_start
+
+        if notation == "move":
+            # Only the chosen move is converted to SAN; an illegal one goes out as UCI
+            # for the server to reject
+            chosen_move = board.san(chosen_move) if chosen_move in moves else str(chosen_move)
+        elif notation == "uci":
+            # The server expects SAN; look the move up in the list we already generated
+            # rather than re-validating it, and leave unknown moves for the server to reject
+            move = dict(zip(legal_moves, moves)).get(chosen_move)
+            if move is not None:
+                chosen_move = board.san(move)
+
+        # Check if move took too long
+        if move_time > search_time:
+            console.print(
+                f"[bold orange]⚠ WARNING: Move took {move_time:.2f}s, "
+                f"exceeding time limit of {search_time:.2f}s![/bold orange]"
+            )
+
+        if self.quiet:
+            # One line per move
+            console.print(Text.assemble(
+                (f"Move {move_count + 1} ({player_color}):", _CHOSEN_LABEL_STYLE), " ",
+                (chosen_move, _CHOSEN_MOVE_STYLE), " ",
+                (f"(time: {move_time:.2f}s)", _DIM_STYLE)
+            ))
+        else:
+            console.print(Text.assemble(
+                ("➜ Chosen move:", _CHOSEN_LABEL_STYLE), " ",
+                (chosen_move, _CHOSEN_MOVE_STYLE), " ",
+                (f"(time: {move_time:.2f}s)", _DIM_STYLE)
+            ))
+
+        # Track if this move was close to or exceeded the time limit
+        self.last_move_time = move_time
+        self.move_exceeded_time_limit = move_time > search_time
+
+        await self.send_message({
+            "type": "make_move",
+            "data": {
+                "game_id": self.game_id,
+                "player_id": self.player_id,
+                "auth_token": self.auth_token,
+                "move": chosen_move
+            }
+        })
+
+        # Plain (non-terminal) output is buffered; push this move's lines out in one go
+        console.file.flush()
+
+        return move_count + 1
+
+    async def _on_move_made(self, msg: Dict[str, Any]) -> bool:
+        """
+        Handle a move by either player: update the board, then reply or record the result.
+
+        :param msg: move_made message from the server
+        :type msg: Dict[str, Any]
+        :return: True if the move ended the game
+        :rtype: bool
+        """
+        board = self.local_board
+        # Ensure player_color is not None (should be set after connecting to a game)
+        player_color = self.player_color or "white"  # fallback to "white" if somehow None
+
+        # Update local board. Applying the move itself is cheaper than parsing the FEN and
+        # keeps the move history for repetition checks; the server's FEN wins if they differ
+        fen = msg.get("fen")
+        move_san = msg.get("move")
+        if move_san:
+            try:
+                board.push_san(move_san)
+            except ValueError:
+                if fen:
+                    board.set_fen(fen)
+            else:
+                if fen and board.fen() != fen:
+                    board.set_fen(fen)
+        elif fen:
+            board.set_fen(fen)
+
+        # On our turn start searching first; the board is drawn while the search runs.
+        # The side to move is a plain attribute, so test it before the costlier outcome()
+        # scan (insufficient material, move-count and repetition rules), which then runs
+        # only on our own turns
+        if (not msg.get("game_over") and ("white" if board.turn else "black") == player_color
+                and board.outcome() is None):
+            self._move_count = await self._play_one_move(self._move_count, self._show_board)
+            return False
+
+        # Display board
+        if self._show_board:
+            console.print()
+            board_pretty_print(board)
+
+        if not msg.get("game_over"):
+            return False
+
+        console.print("\n[bold red]Game over![/bold red]")
+        reason = msg.get("game_over_reason", "Unknown")
+        console.print(f"[yellow]Reason:[/yellow] {reason}")
+
+        # Determine win/loss
+        if "checkmate" in reason.lower():
+            # After checkmate, board.turn is the losing side
+            losing_color = "white" if board.turn else "black"
+            if losing_color == player_color:
+                console.print("[bold red]I lost :([/bold red]")
+                # Check if we lost due to timeout
+                timeout_occurred = self.move_exceeded_time_limit
+                self.update_game_results("loss", timeout_occurred)
+            else:
+                console.print("[bold green]I won :)[/bold green]")
+                self.update_game_results("win")
+        elif "stalemate" in reason.lower() or "draw" in reason.lower():
+            console.print("[yellow]Draw[/yellow]")
+            # Check if draw was due to timeout
+            timeout_occurred = self.move_exceeded_time_limit
+            self.update_game_results("draw", timeout_occurred)
+
+        return True
+
+    async def _on_opponent_disconnected(self, msg: Dict[str, Any]) -> bool:
+        """
+        Handle the opponent dropping out; the game continues if they reconnect.
+
+        :param msg: opponent_disconnected message from the server
+        :type msg: Dict[str, Any]
+        :return: Always False
+        :rtype: bool
+        """
+        console.print("[yellow]⚠ Opponent disconnected - waiting for reconnection...[/yellow]")
+        console.file.flush()
+        return False
+
+    async def _on_game_over(self, msg: Dict[str, Any]) -> bool:
+        """
+        Handle a game ended by forfeit or disqualification and record the result.
+
+        :param msg: game_over message from the server
+        :type msg: Dict[str, Any]
+        :return: Always True
+        :rtype: bool
+        """
+        status = msg.get("status")
+        message = msg.get("message", "Game ended")
+        console.print("\n[bold red]Game over![/bold red]")
+        console.print(f"[yellow]{message}[/yellow]")
+        if status == "forfeit":
+            winner = msg.get("winner")
+            if winner == self.player_id:
+                console.print("[green]✓ You win by forfeit![/green]")
+                console.print("[bold green]I won :)[/bold green]")
+                self.update_game_results("win")
             else:
-                raise Exception(f"Board sync failed after {self.max_reconnect_attempts} "
-                                f"attempts: {str(e)}")
+                console.print("[red]✗ You lost by forfeit[/red]")
+                console.print("[bold red]I lost :([/bold red]")
+                # Check if forfeit was due to timeout
+                timeout_occurred = self.move_exceeded_time_limit
+                self.update_game_results("loss", timeout_occurred)
+        elif status == "disqualified":
+            winner = msg.get("winner")
+            disqualified_player = msg.get("disqualified_player")
+            reason = msg.get("reason", "Time limit exceeded")
+            console.print(f"[red]Disqualification reason: {reason}[/red]")
+            if disqualified_player == self.player_id:
+                console.print("[red bold]✗ You were disqualified![/red bold]")
+                console.print("[bold red]I lost :([/red bold]")
+                # Check if disqualification was due to timeout
+                timeout_occurred = "time" in reason.lower() or "timeout" in reason.lower()
+                self.update_game_results("loss", timeout_occurred)
+            else:
+                console.print("[green]✓ You win by opponent disqualification![/green]")
+                console.print("[bold green]I won :)[/bold green]")
+                self.update_game_results("win")
+        console.file.flush()
+        return True
+
+    async def _on_error(self, msg: Dict[str, Any]) -> bool:
+        """
+        Report an error message from the server.
+
+        :param msg: error message from the server
+        :type msg: Dict[str, Any]
+        :return: Always False
+        :rtype: bool
+        """
+        error_msg = msg.get("message", "Unknown error")
+        console.print(f"[red]✗ Error:[/red] {error_msg}")
+        console.file.flush()
+        return False
+
+    async def _handle_game_messages(self, move_count: int, show_board: bool) -> bool:
+        """
+        Process game messages until the game ends or the connection is lost.
+
+        Each message type is dispatched through the _handlers table; types without a
+        handler are ignored.
+
+        :param move_count: Number of moves this client has made so far
+        :type move_count: int
+        :param show_board: Whether to draw the board after every move
+        :type show_board: bool
+        :return: True if the game finished, False if the connection closed first
+        :rtype: bool
+        """
+        self._move_count = move_count
+        self._show_board = show_board
+        # Bind attributes used on every message to locals
+        handlers = self._handlers
+        next_message = self.message_queue.get
+
+        while True:
+            msg_type, msg = await next_message()
+            if msg_type is None:
+                # Connection-closed marker; a stale one from a replaced connection is ignored
+                if self._receive_task is None or self._receive_task.done():
+                    return False
+                continue
+
+            handler = handlers.get(msg_type)
+            if handler is not None and await handler(msg):
+                return True
 
     async def run(self) -> None:
         """
@@ -620,18 +1232,13 @@ class ChessClient:
         console.print(f"[cyan]Search time:[/cyan] {self.strategy.search_time}s")
         console.print(f"[cyan]Server:[/cyan] {self.server_url}")
 
-        try:
-            async with websockets.connect(self.server_url + "/ws") as websocket:
-                self.websocket = websocket
-
-                # Start background task to receive messages
-                self._receive_task = asyncio.create_task(self.receive_messages())
-
-                # Start heartbeat task for connection health
-                self._heartbeat_task = asyncio.create_task(self.send_heartbeat())
+        # Warm the strategy up in a worker thread, overlapping the connection handshake
+        # and the wait for an opponent
+        loop = asyncio.get_running_loop()
+        warmup_task = loop.run_in_executor(self._strategy_executor, self._prepare_strategy)
 
-                # Start connection health monitoring task
-                self._health_monitor_task = asyncio.create_task(self.monitor_connection_health())
+        try:
+            async with await self._connect():
 
                 # If continuing a game, skip matchmaking
                 if self.continue_game and self.game_id and self.player_id and self.auth_token:
@@ -644,6 +1251,8 @@ class ChessClient:
                     console.print("\n[yellow]⏳ Joining matchmaking queue...[/yellow]")
                     console.print("[dim]Waiting for opponent...[/dim]")
 
+                    # Register for the reply before joining so it cannot be missed
+                    reply = self._expect_message("match_found", "queue_timeout")
                     await self.send_message({"type": "join_queue"})
 
                     # Wait for match
@@ -655,11 +1264,11 @@ class ChessClient:
 
                 while not match_found:
                     try:
-                        if self.timeout is not None:
-                            msg = await asyncio.wait_for(self.message_queue.get(), timeout=self.timeout)
-                        else:
-                            msg = await self.message_queue.get()
+                        # With no timeout set this simply waits for the reply
+                        msg = await asyncio.wait_for(reply, timeout=self.timeout)
                     except asyncio.TimeoutError:
+                        # Listen again straight away, so a match that arrives during the retry delay is kept
+                        reply = self._expect_message("match_found", "queue_timeout")
                         # Instead of exiting, try rejoining queue with progressive timeout
                         queue_retry_count += 1
                         if queue_retry_count <= max_queue_retries:
@@ -678,14 +1287,14 @@ class ChessClient:
                             # Increase timeout for next attempt to be more patient
                             if self.timeout is not None:
                                 self.timeout = min(self.timeout * 1.5, 300.0)  # Cap at 5 minutes
+                            continue
                         else:
                             console.print(
                                 f"[red]✗ Queue timeout after {max_queue_retries} retries "
                                 f"({self.timeout} seconds elapsed)[/red]")
                             return  # Exit the run method, which will terminate the client
 
-                    msg_type = msg.get("type")
-
+                    msg_type = msg["type"]
                     if msg_type == "match_found":
                         self.game_id = msg["game_id"]
                         self.player_id = msg["player_id"]
@@ -720,7 +1329,7 @@ class ChessClient:
                                 self.strategy.search_time = final_search_time
 
                         # Save auth token for reconnection
-                        self.save_auth_token()
+                        await self.save_auth_token()
 
                         if self.player_id == first_move_player:
                             console.print("[green]You move first (White)[/green]")
@@ -731,6 +1340,7 @@ class ChessClient:
 
                     elif msg_type == "queue_timeout":
                         console.print("[red]✗ Queue timeout, retrying...[/red]")
+                        reply = self._expect_message("match_found", "queue_timeout")
                         await asyncio.sleep(1)
                         await self.send_message({"type": "join_queue"})
 
@@ -740,257 +1350,66 @@ class ChessClient:
 
                 # Main game loop
                 move_count = 0
-                game_over = False
+
+                board = self.local_board
+                # Ensure player_color is not None (should be set after connecting to a game)
+                player_color = self.player_color or "white"  # fallback to "white" if somehow None
+                # The board diagram is only for watching the game; skip it when output is
+                # piped to a log or CHESS_ARENA_QUIET is set (e.g. tournament runs)
+                show_board = console.is_terminal and not (self.quiet or os.environ.get("CHESS_ARENA_QUIET"))
 
                 # Reset move timing tracking for new game
                 self.last_move_time = 0.0
                 self.move_exceeded_time_limit = False
 
-                # If reconnecting and it's our turn, make a move
-                if self.continue_game and is_our_turn and not self.local_board.is_game_over():
-                    legal_moves = [self.local_board.san(m) for m in self.local_board.legal_moves]
-                    if legal_moves:
-                        console.print(
-                            f"\n[bold magenta]━━━ Move {move_count + 1} ({self.player_color}) ━━━[/bold magenta]")
-                        console.print(f"[cyan]Game ID:[/cyan] [bold]{self.game_id}[/bold]")
-                        console.print(f"[cyan]Client:[/cyan] [bold]{self.player_id}[/bold]")
-                        console.print(f"[dim]Legal moves ({len(legal_moves)}):[/dim] {', '.join(legal_moves[:10])}...")
-
-                        move_start = time.time()
-                        # Ensure player_color is not None (should be set after connecting to a game)
-                        player_color = self.player_color or "white"  # fallback to "white" if somehow None
-                        chosen_move = self.strategy.choose_move(self.local_board, legal_moves, player_color)
-                        move_time = time.time() - move_start
-
-                        # Check if move took too long
-                        if move_time > self.strategy.search_time:
-                            console.print(
-                                f"[bold orange]⚠ WARNING: Move took {move_time:.2f}s, "
-                                f"exceeding time limit of {self.strategy.search_time:.2f}s![/bold orange]"
-                            )
-
-                        console.print(
-                            f"[bold green]➜ Chosen move:[/bold green] "
-                            f"[bold white]{chosen_move}[/bold white] [dim](time: {move_time:.2f}s)[/dim]"
-                        )
-
-                        # Track if this move was close to or exceeded the time limit
-                        self.last_move_time = move_time
-                        self.move_exceeded_time_limit = move_time > self.strategy.search_time
-
-                        await self.send_message({
-                            "type": "make_move",
-                            "data": {
-                                "game_id": self.game_id,
-                                "player_id": self.player_id,
-                                "auth_token": self.auth_token,
-                                "move": chosen_move
-                            }
-                        })
-
-                        move_count += 1
-
-                while not game_over:
-                    try:
-                        msg = await asyncio.wait_for(self.message_queue.get(), timeout=0.1)
-                        msg_type = msg.get("type")
-
-                        if msg_type == "move_made":
-                            # Update local board
-                            fen = msg.get("fen")
-                            if fen:
-                                self.local_board.set_fen(fen)
-
-                            # Display board
-                            console.print()
-                            board_pretty_print(self.local_board)
-
-                            if msg.get("game_over"):
-                                console.print("\n[bold red]Game over![/bold red]")
-                                reason = msg.get("game_over_reason", "Unknown")
-                                console.print(f"[yellow]Reason:[/yellow] {reason}")
-
-                                # Determine win/loss
-                                if "checkmate" in reason.lower():
-                                    # After checkmate, board.turn is the losing side
-                                    losing_color = "white" if self.local_board.turn else "black"
-                                    if losing_color == self.player_color:
-                                        console.print("[bold red]I lost :([/bold red]")
-                                        # Check if we lost due to timeout
-                                        timeout_occurred = self.move_exceeded_time_limit
-                                        self.update_game_results("loss", timeout_occurred)
-                                    else:
-                                        console.print("[bold green]I won :)[/bold green]")
-                                        self.update_game_results("win")
-                                elif "stalemate" in reason.lower() or "draw" in reason.lower():
-                                    console.print("[yellow]Draw[/yellow]")
-                                    # Check if draw was due to timeout
-                                    timeout_occurred = self.move_exceeded_time_limit
-                                    self.update_game_results("draw", timeout_occurred)
-
-                                game_over = True
-                                continue
-
-                            # Check if it's our turn
-                            if not self.local_board.is_game_over():
-                                current_turn = "white" if self.local_board.turn else "black"
-                                if current_turn == self.player_color:
-                                    # Our turn - make a move
-                                    legal_moves = [self.local_board.san(m) for m in self.local_board.legal_moves]
-
-                                    if not legal_moves:
-                                        console.print("[bold red]No legal moves - game over[/bold red]")
-                                        game_over = True
-                                        continue
-
-                                    console.print(
-                                        f"\n[bold magenta]━━━ Move {move_count + 1} "
-                                        f"({self.player_color}) ━━━[/bold magenta]"
-                                    )
-                                    console.print(f"[cyan]Game ID:[/cyan] [bold]{self.game_id}[/bold]")
-                                    console.print(f"[cyan]Client:[/cyan] [bold]{self.player_id}[/bold]")
-                                    moves_preview = ', '.join(legal_moves[:10])
-                                    console.print(f"[dim]Legal moves ({len(legal_moves)}):[/dim] {moves_preview}...")
-
-                                    move_start = time.time()
-                                    # Ensure player_color is not None (should be set after connecting to a game)
-                                    player_color = self.player_color or "white"  # fallback to "white" if somehow None
-                                    chosen_move = self.strategy.choose_move(
-                                        self.local_board, legal_moves, player_color)
-                                    move_time = time.time() - move_start
-
-                                    # Check if move took too long
-                                    if move_time > self.strategy.search_time:
-                                        console.print(
-                                            f"[bold orange]⚠ WARNING: Move took {move_time:.2f}s, "
-                                            f"exceeding time limit of {self.strategy.search_time:.2f}s![/bold orange]"
-                                        )
-
-                                    console.print(
-                                        f"[bold green]➜ Chosen move:[/bold green] "
-                                        f"[bold white]{chosen_move}[/bold white] [dim](time: {move_time:.2f}s)[/dim]"
-                                    )
-
-                                    # Track if this move was close to or exceeded the time limit
-                                    self.last_move_time = move_time
-                                    self.move_exceeded_time_limit = move_time > self.strategy.search_time
-
-                                    # Send move
-                                    await self.send_message({
-                                        "type": "make_move",
-                                        "data": {
-                                            "game_id": self.game_id,
-                                            "player_id": self.player_id,
-                                            "auth_token": self.auth_token,
-                                            "move": chosen_move
-                                        }
-                                    })
-
-                                    move_count += 1
-
-                        elif msg_type == "opponent_disconnected":
-                            console.print("[yellow]⚠ Opponent disconnected - waiting for reconnection...[/yellow]")
-
-                        elif msg_type == "game_over":
-                            status = msg.get("status")
-                            message = msg.get("message", "Game ended")
-                            console.print("\n[bold red]Game over![/bold red]")
-                            console.print(f"[yellow]{message}[/yellow]")
-                            if status == "forfeit":
-                                winner = msg.get("winner")
-                                if winner == self.player_id:
-                                    console.print("[green]✓ You win by forfeit![/green]")
-                                    console.print("[bold green]I won :)[/bold green]")
-                                    self.update_game_results("win")
-                                else:
-                                    console.print("[red]✗ You lost by forfeit[/red]")
-                                    console.print("[bold red]I lost :([/bold red]")
-                                    # Check if forfeit was due to timeout
-                                    timeout_occurred = self.move_exceeded_time_limit
-                                    self.update_game_results("loss", timeout_occurred)
-                            elif status == "disqualified":
-                                winner = msg.get("winner")
-                                disqualified_player = msg.get("disqualified_player")
-                                reason = msg.get("reason", "Time limit exceeded")
-                                console.print(f"[red]Disqualification reason: {reason}[/red]")
-                                if disqualified_player == self.player_id:
-                                    console.print("[red bold]✗ You were disqualified![/red bold]")
-                                    console.print("[bold red]I lost :([/red bold]")
-                                    # Check if disqualification was due to timeout
-                                    timeout_occurred = "time" in reason.lower() or "timeout" in reason.lower()
-                                    self.update_game_results("loss", timeout_occurred)
-                                else:
-                                    console.print("[green]✓ You win by opponent disqualification![/green]")
-                                    console.print("[bold green]I won :)[/bold green]")
-                                    self.update_game_results("win")
-                            game_over = True
-
-                        elif msg_type == "error":
-                            error_msg = msg.get("message", "Unknown error")
-                            console.print(f"[red]✗ Error:[/red] {error_msg}")
-
-                    except asyncio.TimeoutError:
-                        # Check if it's our turn to move initially
-                        if self.game_id and not self.local_board.is_game_over():
-                            current_turn = "white" if self.local_board.turn else "black"
-                            if current_turn == self.player_color and move_count == 0:
-                                # Make first move
-                                legal_moves = [self.local_board.san(m) for m in self.local_board.legal_moves]
-
-                                console.print(f"\n[bold magenta]━━━ Move 1 ({self.player_color}) ━━━[/bold magenta]")
-                                console.print(f"[cyan]Game ID:[/cyan] [bold]{self.game_id}[/bold]")
-                                console.print(f"[cyan]Client:[/cyan] [bold]{self.player_id}[/bold]")
-                                console.print(
-                                    f"[dim]Legal moves ({len(legal_moves)}):[/dim] {', '.join(legal_moves[:10])}...")
-
-                                move_start = time.time()
-                                # Ensure player_color is not None (should be set after connecting to a game)
-                                player_color = self.player_color or "white"  # fallback to "white" if somehow None
-                                chosen_move = self.strategy.choose_move(
-                                    self.local_board, legal_moves, player_color)
-                                move_time = time.time() - move_start
-
-                                # Check if move took too long
-                                if move_time > self.strategy.search_time:
-                                    console.print(
-                                        f"[bold orange]⚠ WARNING: Move took {move_time:.2f}s, "
-                                        f"exceeding time limit of {self.strategy.search_time:.2f}s![/bold orange]"
-                                    )
-
-                                console.print(
-                                    f"[bold green]➜ Chosen move:[/bold green] [bold white]{chosen_move}[/bold white] "
-                                    f"[dim](time: {move_time:.2f}s)[/dim]"
-                                )
+                # Strategy setup must finish before its first timed move
+                try:
+                    await warmup_task
+                except Exception as e:
+                    console.print(f"[yellow]⚠ Strategy warmup failed: {e}[/yellow]")
 
-                                # Track if this move was close to or exceeded the time limit
-                                self.last_move_time = move_time
-                                self.move_exceeded_time_limit = move_time > self.strategy.search_time
+                # Make the first move straight away if the synced position has us to move
+                current_turn = "white" if board.turn else "black"
+                if (is_our_turn or current_turn == player_color) and board.outcome() is None:
+                    move_count = await self._play_one_move(move_count)
 
-                                await self.send_message({
-                                    "type": "make_move",
-                                    "data": {
-                                        "game_id": self.game_id,
-                                        "player_id": self.player_id,
-                                        "auth_token": self.auth_token,
-                                        "move": chosen_move
-                                    }
-                                })
+                if not await self._handle_game_messages(move_count, show_board):
+                    console.print("[red]✗ Connection lost before the game finished[/red]")
 
-                                move_count += 1
-                        continue
+                # Keep what the strategy learned for the next game
+                await loop.run_in_executor(self._strategy_executor, self._save_transposition_table)
 
                 # Cancel background tasks
-                if self._receive_task is not None and not self._receive_task.done():
-                    self._receive_task.cancel()
-                if self._heartbeat_task is not None and not self._heartbeat_task.done():
-                    self._heartbeat_task.cancel()
-                if self._health_monitor_task is not None and not self._health_monitor_task.done():
-                    self._health_monitor_task.cancel()
+                await self._cancel_bg_tasks()
+                # Close the current connection too, in case a reconnect replaced the one opened above
+                if self.websocket:
+                    await self.websocket.close()
 
         except KeyboardInterrupt:
             console.print("\n[yellow]⚠ Client stopped by user[/yellow]")
         except Exception as e:
             console.print(f"[red]✗ Connection error:[/red] {e}")
+        finally:
+            # The strategy thread is not a daemon, so the interpreter waits for it at exit;
+            # stop a search that is still running instead of letting it use its full time
+            self.strategy.stop()
+            self._strategy_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_event_loop(coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a coroutine to completion, using uvloop's libuv-based event loop when it is installed.
+
+    :param coro: Coroutine to run
+    :type coro: Coroutine[Any, Any, None]
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+        return
+
+    uvloop.run(coro)
 
 
 def load_strategy_from_file(file_path: str, search_time: float) -> StrategyBase:
@@ -1007,13 +1426,22 @@ def load_strategy_from_file(file_path: str, search_time: float) -> StrategyBase:
     :raises AttributeError: If the Strategy class is not found
     """
     try:
-        spec = importlib.util.spec_from_file_location("strategy_module", file_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Cannot load module from {file_path}")
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["strategy_module"] = module
-        spec.loader.exec_module(module)
+        # The source loader already reuses __pycache__ bytecode; this also skips
+        # re-executing a module that was loaded before and has not changed since
+        cache_key = (os.path.abspath(file_path), os.stat(file_path).st_mtime_ns)
+        module = _strategy_modules.get(cache_key)
+        if module is None:
+            # Only needed for custom strategy files, so not imported with the module
+            import importlib.util
+
+            spec = importlib.util.spec_from_file_location("strategy_module", file_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load module from {file_path}")
+
+            module = importlib.util.module_from_spec(spec)
+            sys.modules["strategy_module"] = module
+            spec.loader.exec_module(module)
+            _strategy_modules[cache_key] = module
 
         if not hasattr(module, 'Strategy'):
             raise AttributeError(f"Strategy class not found in {file_path}")
@@ -1029,6 +1457,14 @@ def main() -> None:
     """
     Parse command-line arguments and start the chess client.
     """
+    # Imported here rather than at module level: only the command line needs it
+    import argparse
+
+    global console
+    # Skip rich rendering entirely when output goes to a pipe or log file
+    if not sys.stdout.isatty():
+        console = _PlainConsole()
+
     parser = argparse.ArgumentParser(description='Chess Arena Client - WebSocket Edition')
     parser.add_argument('--search-time', type=float, default=300.0,
                         help='Maximum search time per move in seconds (default: 300.0)')
@@ -1052,6 +1488,10 @@ def main() -> None:
                         help='Path to file for storing game results in JSON format')
     parser.add_argument('--aggressive-reconnect', action='store_true',
                         help='Enable aggressive reconnection with infinite retries for critical operations')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Print one line per move and no board diagrams')
+    parser.add_argument('--tt-file', type=str, default=None,
+                        help='Path to file for keeping the strategy\'s transposition table between games')
 
     args = parser.parse_args()
 
@@ -1063,8 +1503,11 @@ def main() -> None:
         console.print(f"[cyan]Using custom strategy:[/cyan] {args.strategy}")
     else:
         # Use default strategy.py from the package
-        from chess_arena_client.strategy import Strategy
-        strategy = Strategy(search_time=args.search_time)
+        from chess_arena_client import strategy as strategy_module
+
+        # Its per-depth search lines go through its own console; share the plain one
+        strategy_module.console = console
+        strategy = strategy_module.Strategy(search_time=args.search_time)
         console.print("[cyan]Using default strategy[/cyan]")
 
     # If --continue flag is set, try to load auth token
@@ -1083,27 +1526,30 @@ def main() -> None:
                                  max_reconnect_attempts=args.max_reconnect_attempts,
                                  reconnect_delay=args.reconnect_delay, timeout=args.timeout,
                                  store_result_file=args.store_result,
-                                 aggressive_reconnect=args.aggressive_reconnect)
+                                 aggressive_reconnect=args.aggressive_reconnect,
+                                 tt_file=args.tt_file, quiet=args.quiet)
             client.game_id = game_id
             client.player_id = player_id
             client.player_color = player_color
             client.auth_token = auth_token
-            asyncio.run(client.run())
+            run_event_loop(client.run())
         else:
             console.print("[red]✗ No saved auth token found. Starting new game instead.[/red]")
             client = ChessClient(server_url, strategy, auth_file=args.auth_file,
                                  max_reconnect_attempts=args.max_reconnect_attempts,
                                  reconnect_delay=args.reconnect_delay, timeout=args.timeout,
                                  store_result_file=args.store_result,
-                                 aggressive_reconnect=args.aggressive_reconnect)
-            asyncio.run(client.run())
+                                 aggressive_reconnect=args.aggressive_reconnect,
+                                 tt_file=args.tt_file, quiet=args.quiet)
+            run_event_loop(client.run())
     else:
         client = ChessClient(server_url, strategy, auth_file=args.auth_file,
                              max_reconnect_attempts=args.max_reconnect_attempts,
                              reconnect_delay=args.reconnect_delay, timeout=args.timeout,
                              store_result_file=args.store_result,
-                             aggressive_reconnect=args.aggressive_reconnect)
-        asyncio.run(client.run())
+                             aggressive_reconnect=args.aggressive_reconnect,
+                             tt_file=args.tt_file, quiet=args.quiet)
+        run_event_loop(client.run())
 
 
 if __name__ == '__main__':
@@ -6,8 +6,13 @@ Uses iterative deepening, piece-square tables, and move ordering
 for efficient search.
 """
 
+import multiprocessing
+import os
 import time
-from typing import List, Optional, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import chess
 from rich.console import Console
@@ -16,11 +21,8 @@ from chess_arena_client.strategy_base import StrategyBase
 
 console = Console()
 
-# Piece values for material evaluation
-PIECE_VALUES = {
-    'P': 100, 'N': 320, 'B': 330, 'R': 500, 'Q': 900, 'K': 20000,
-    'p': -100, 'n': -320, 'b': -330, 'r': -500, 'q': -900, 'k': -20000
-}
+# Piece values for material evaluation, indexed by chess.PieceType (chess.PAWN=1 ... chess.KING=6)
+MATERIAL = [0, 100, 320, 330, 500, 900, 20000]
 
 # Piece-square tables for positional evaluation (from white's perspective)
 # Pawns: encourage center control and advancement
@@ -95,14 +97,289 @@ KING_MIDDLEGAME_TABLE = [
     20, 30, 10, 0, 0, 10, 30, 20
 ]
 
-PIECE_SQUARE_TABLES = {
-    'P': PAWN_TABLE,
-    'N': KNIGHT_TABLE,
-    'B': BISHOP_TABLE,
-    'R': ROOK_TABLE,
-    'Q': QUEEN_TABLE,
-    'K': KING_MIDDLEGAME_TABLE
-}
+# Piece-square tables indexed by chess.PieceType, like MATERIAL
+PIECE_SQUARE_TABLES = [
+    [0] * 64,
+    PAWN_TABLE,
+    KNIGHT_TABLE,
+    BISHOP_TABLE,
+    ROOK_TABLE,
+    QUEEN_TABLE,
+    KING_MIDDLEGAME_TABLE
+]
+
+
+def _build_pst() -> List[List[List[int]]]:
+    """
+    Combine material and piece-square bonuses into one table per piece type and color.
+
+    :return: Signed values (positive favors White) indexed [piece_type][color][square];
+        index 0 is unused, so chess.PAWN through chess.KING index it directly
+    :rtype: List[List[List[int]]]
+    """
+    pst = [[[0] * 64, [0] * 64]]
+    for piece_type in chess.PIECE_TYPES:
+        table = PIECE_SQUARE_TABLES[piece_type]
+        material = MATERIAL[piece_type]
+        by_color = [[0] * 64, [0] * 64]
+        for square in chess.SQUARES:
+            # chess uses 0=a1 ... 63=h8; the tables run from rank 8 (index 0) down to rank 1,
+            # so White's ranks are flipped and Black's mirror them
+            rank, file = square >> 3, square & 7
+            by_color[chess.WHITE][square] = material + table[(7 - rank) * 8 + file]
+            by_color[chess.BLACK][square] = -(material + table[rank * 8 + file])
+        pst.append(by_color)
+    return pst
+
+
+# Material plus piece-square value by [piece_type][color][square]
+PST = _build_pst()
+
+
+def material_score(board: chess.Board) -> int:
+    """
+    Sum material and piece-square values over the whole board, from White's perspective.
+
+    Walks each piece bitboard directly instead of building Piece objects via piece_map().
+
+    :param board: Board to score
+    :type board: chess.Board
+    :return: Score (positive favors White)
+    :rtype: int
+    """
+    pst = PST
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    score = 0
+    for piece_type, mask in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                             (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                             (chess.QUEEN, board.queens), (chess.KING, board.kings)):
+        black_table, white_table = pst[piece_type]  # indexed by color, BLACK == 0
+        for square in chess.scan_forward(mask & white):
+            score += white_table[square]
+        for square in chess.scan_forward(mask & black):
+            score += black_table[square]
+    return score
+
+
+class EvalBoard(chess.Board):
+    """
+    Board that keeps its material and piece-square score up to date move by move.
+
+    push() adds the change caused by the move and pop() restores the previous score, so
+    evaluating a searched position does not have to sum the whole board again. Only
+    push(), pop() and copy() keep the score current; other ways of changing the position
+    (set_fen(), remove_piece_at() and the like) do not.
+
+    :param fen: Starting position
+    :type fen: Optional[str]
+    :param chess960: Whether the board is in Chess960 mode
+    :type chess960: bool
+    """
+
+    def __init__(self, fen: Optional[str] = chess.STARTING_FEN, *, chess960: bool = False) -> None:
+        super().__init__(fen, chess960=chess960)
+        self.score = material_score(self)
+        # Score before each move on the move stack
+        self._scores: List[int] = []
+
+    @classmethod
+    def from_board(cls, board: chess.Board) -> "EvalBoard":
+        """
+        Create an EvalBoard with the same position as a regular board.
+
+        Only the moves since the last capture or pawn move are carried over: no earlier
+        position can occur again, so they are not needed to detect repetitions.
+
+        :param board: Board to copy
+        :type board: chess.Board
+        :return: Equivalent EvalBoard
+        :rtype: EvalBoard
+        """
+        recent = board.copy(stack=board.halfmove_clock)
+        eval_board = cls(recent.root().fen(), chess960=board.chess960)
+        for move in recent.move_stack:
+            eval_board.push(move)
+        return eval_board
+
+    def push(self, move: chess.Move) -> None:
+        self._scores.append(self.score)
+        self.score += self._score_change(move)
+        super().push(move)
+
+    def pop(self) -> chess.Move:
+        move = super().pop()
+        self.score = self._scores.pop()
+        return move
+
+    def copy(self, *, stack: Union[bool, int] = True) -> "EvalBoard":
+        board = super().copy(stack=stack)
+        board.score = self.score
+        board._scores = self._scores[-len(board.move_stack):] if board.move_stack else []
+        return board
+
+    def _score_change(self, move: chess.Move) -> int:
+        """
+        Work out how a move, not yet pushed, changes the score.
+
+        :param move: Move about to be made
+        :type move: chess.Move
+        :return: Score difference (positive favors White)
+        :rtype: int
+        """
+        if not move:
+            return 0  # null move
+
+        us = self.turn
+        them = not us
+        from_square, to_square = move.from_square, move.to_square
+        piece_type = self.piece_type_at(from_square)
+        if piece_type is None:
+            return 0
+
+        if piece_type == chess.KING and self.is_castling(move):
+            # The king lands on the g- or c-file and the rook next to it, whether the move
+            # is given as e1g1 or as king-takes-rook
+            rank = chess.square_rank(from_square)
+            kingside = self.is_kingside_castling(move)
+            if self.occupied_co[us] & chess.BB_SQUARES[to_square]:
+                rook_from = to_square
+            else:
+                rook_from = chess.square(7 if kingside else 0, rank)
+            king_table, rook_table = PST[chess.KING][us], PST[chess.ROOK][us]
+            return (king_table[chess.square(6 if kingside else 2, rank)] - king_table[from_square]
+                    + rook_table[chess.square(5 if kingside else 3, rank)] - rook_table[rook_from])
+
+        change = PST[move.promotion or piece_type][us][to_square] - PST[piece_type][us][from_square]
+        captured = self.piece_type_at(to_square)
+        if captured is not None:
+            change -= PST[captured][them][to_square]
+        elif piece_type == chess.PAWN and to_square == self.ep_square:
+            # En passant: the captured pawn stands behind the target square
+            change -= PST[chess.PAWN][them][to_square ^ 8]
+        return change
+
+
+def has_non_pawn_material(board: chess.Board) -> bool:
+    """
+    Check whether the side to move has any piece besides pawns and its king.
+
+    Null-move pruning is skipped without one, since pawn endgames are where zugzwang
+    (every move makes things worse) is common.
+
+    :param board: Current board position
+    :type board: chess.Board
+    :return: True if the side to move has a knight, bishop, rook or queen
+    :rtype: bool
+    """
+    return bool(board.occupied_co[board.turn] & ~(board.pawns | board.kings))
+
+
+def position_key(board: chess.Board) -> int:
+    """
+    Hash a position for the transposition table and evaluation cache.
+
+    Covers the same fields as python-chess's board._transposition_key(), but marks "no en
+    passant" with -1 instead of None. On Python 3.11 hash(None) depends on where None sits
+    in memory, while a tuple of ints hashes the same in every process, so tables saved by
+    one game can be probed in the next.
+
+    :param board: Current board position
+    :type board: chess.Board
+    :return: Position hash, stable across processes
+    :rtype: int
+    """
+    ep_square = board.ep_square
+    if ep_square is None or not board.has_legal_en_passant():
+        ep_square = -1
+    return hash((board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings,
+                 board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK],
+                 board.turn, board.clean_castling_rights(), ep_square))
+
+
+# Transposition table entry flags: the stored value is exact, a lower bound (the search
+# failed high) or an upper bound (it failed low)
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Number of transposition table slots (a power of two); a position's slot is picked by
+# the low bits of its hash
+TT_SIZE = 1 << 20
+TT_MASK = TT_SIZE - 1
+
+# Positions kept in the evaluation cache before it is emptied and refilled
+EVAL_CACHE_SIZE = 1 << 16
+
+# Plies with their own killer move slots
+MAX_PLY = 64
+
+# Depth reduction for the null-move search
+NULL_MOVE_REDUCTION = 2
+
+# The clock is read once every TIME_CHECK_MASK + 1 nodes (a power of two)
+TIME_CHECK_MASK = 127
+
+# Half-width of the root search window around the previous iteration's score
+ASPIRATION_WINDOW = 50
+
+
+# Per-process strategy used by _search_root_moves, so each worker keeps its
+# transposition table between searches
+_worker_strategy: Optional["Strategy"] = None
+
+
+def _search_root_moves(board: EvalBoard, moves: List[chess.Move], depth: int, alpha: int, beta: int,
+                       maximizing: bool, deadline: float) -> Tuple[int, Optional[chess.Move], int, bool]:
+    """
+    Search some of the root moves in a worker process.
+
+    :param board: Root position
+    :type board: EvalBoard
+    :param moves: Root moves for this worker, in search order
+    :type moves: List[chess.Move]
+    :param depth: Search depth, counting the root move
+    :type depth: int
+    :param alpha: Alpha value for pruning
+    :type alpha: int
+    :param beta: Beta value for pruning
+    :type beta: int
+    :param maximizing: True if the side to move is White
+    :type maximizing: bool
+    :param deadline: Time by which the search must end, from time.time() (clocks like
+        perf_counter() are not comparable between processes)
+    :type deadline: float
+    :return: Tuple of (evaluation, best move, nodes searched, whether time ran out)
+    :rtype: Tuple[int, Optional[chess.Move], int, bool]
+    """
+    global _worker_strategy
+    if _worker_strategy is None:
+        _worker_strategy = Strategy(1.0, workers=1)
+        _worker_strategy.warmup()
+    strategy = _worker_strategy
+    # minimax stops at 95% of search_time, as in the main process
+    strategy.search_time = (deadline - time.time()) / 0.95
+    strategy.nodes_searched = 0
+    strategy.search_aborted = False
+    start_time = time.perf_counter()
+
+    best_value = -1000000 if maximizing else 1000000
+    best_move = None
+    for move in moves:
+        board.push(move)
+        value, _ = strategy.minimax(board, depth - 1, alpha, beta, not maximizing, start_time, 1)
+        board.pop()
+        if strategy.search_aborted:
+            break
+        if maximizing and value > best_value:
+            best_value, best_move = value, move
+            alpha = max(alpha, value)
+        elif not maximizing and value < best_value:
+            best_value, best_move = value, move
+            beta = min(beta, value)
+        if beta <= alpha:
+            break
+    return best_value, best_move, strategy.nodes_searched, strategy.search_aborted
 
 
 class Strategy(StrategyBase):
@@ -112,13 +389,162 @@ class Strategy(StrategyBase):
     Uses piece-square tables for positional evaluation and move ordering
     (captures, checks) for efficient search.
 
+    With more than one worker, each depth's root moves are split between that many
+    processes, which search their share independently.
+
     :param search_time: Maximum time in seconds for move search
     :type search_time: float
+    :param workers: Number of search processes (default: CHESS_ARENA_WORKERS, or 1)
+    :type workers: Optional[int]
     """
 
-    def __init__(self, search_time: float):
+    def __init__(self, search_time: float, workers: Optional[int] = None):
         super().__init__(search_time)
+        if workers is None:
+            workers = int(os.environ.get("CHESS_ARENA_WORKERS", "1"))
+        self.workers = max(1, workers)
+        # Started on first use (or by warmup) and kept for the whole game
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.nodes_searched = 0
+        # Transposition table, kept across moves since later positions are often reached
+        # again. Each slot holds a position hash and one int packing value, depth, flag and
+        # best move (see _store), 16 bytes per slot instead of a dict entry's several hundred
+        self.tt_keys = array('q', [0]) * TT_SIZE
+        self.tt_data = array('q', [0]) * TT_SIZE
+        # Static evaluations by position hash; quiescence reaches the same positions
+        # through different capture orders and skips the terminal checks on a hit
+        self.eval_cache: Dict[int, int] = {}
+        # Set when the time limit cut a search short; its scores are then not stored
+        self.search_aborted = False
+        # Set by stop(); every later search aborts straight away
+        self._stop_requested = False
+        # Killer moves: the last two quiet moves that caused a cutoff at each ply
+        self.killers: List[List[Optional[chess.Move]]] = [[None, None] for _ in range(MAX_PLY)]
+        # History heuristic: cutoff score of each quiet move, by [from_square][to_square]
+        self.history = [[0] * 64 for _ in range(64)]
+
+    def warmup(self) -> None:
+        """
+        Run a shallow search from the starting position before the first move.
+
+        Touches the evaluation, move ordering and search code once so the first timed
+        search does not pay for that warm-up.
+        """
+        self.minimax(chess.Board(), 2, -1000000, 1000000, True, time.perf_counter())
         self.nodes_searched = 0
+        self.search_aborted = self._stop_requested
+        if self._stop_requested:
+            return
+
+        if self.workers > 1:
+            # Start the worker processes now; each imports this module and warms up in turn
+            pool = self._get_pool()
+            for future in [pool.submit(_search_root_moves, EvalBoard(), [], 1, -1000000, 1000000, True,
+                                       time.time() + self.search_time) for _ in range(self.workers)]:
+                future.result()
+
+    def stop(self) -> None:
+        """
+        Abort the running search and any later one, and shut the worker processes down.
+
+        The search checks search_aborted at every node, so it unwinds within a few moves
+        and choose_move returns the best move found so far.
+        """
+        self._stop_requested = True
+        self.search_aborted = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_transposition_table(self) -> Optional[bytes]:
+        """
+        Serialize the transposition table: the raw key array followed by the data array.
+
+        :return: Serialized table
+        :rtype: Optional[bytes]
+        """
+        return self.tt_keys.tobytes() + self.tt_data.tobytes()
+
+    def set_transposition_table(self, data: bytes) -> None:
+        """
+        Restore a transposition table saved by get_transposition_table().
+
+        A table of a different size (saved with another TT_SIZE) is ignored.
+
+        :param data: Serialized table from a previous game
+        :type data: bytes
+        """
+        size = TT_SIZE * self.tt_keys.itemsize
+        if len(data) != 2 * size:
+            console.print("[yellow]⚠ Transposition table file does not match TT_SIZE, ignoring it[/yellow]")
+            return
+        tt_keys = array('q')
+        tt_keys.frombytes(data[:size])
+        tt_data = array('q')
+        tt_data.frombytes(data[size:])
+        self.tt_keys = tt_keys
+        self.tt_data = tt_data
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the worker process pool, starting it if needed.
+
+        Workers are spawned rather than forked, since the client runs searches from a
+        thread alongside its event loop.
+
+        :return: Process pool with one process per worker
+        :rtype: ProcessPoolExecutor
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _search_root_parallel(self, board: EvalBoard, depth: int, alpha: int, beta: int,
+                              maximizing: bool, start_time: float,
+                              first_move: Optional[chess.Move] = None) -> Tuple[int, Optional[chess.Move]]:
+        """
+        Search the root position to a fixed depth with the moves split across processes.
+
+        Moves are dealt out round-robin in search order, so each worker starts with one
+        of the most promising moves. Workers do not share bounds or transposition
+        tables, so they search more nodes in total than one process would.
+
+        :param board: Root position
+        :type board: EvalBoard
+        :param depth: Search depth
+        :type depth: int
+        :param alpha: Alpha value for pruning
+        :type alpha: int
+        :param beta: Beta value for pruning
+        :type beta: int
+        :param maximizing: True if maximizing player (White)
+        :type maximizing: bool
+        :param start_time: Search start time from time.perf_counter()
+        :type start_time: float
+        :param first_move: Move to search first, usually the previous depth's best
+        :type first_move: Optional[chess.Move]
+        :return: Tuple of (evaluation, best_move); best_move is None if time ran out
+        :rtype: Tuple[int, Optional[chess.Move]]
+        """
+        moves = list(self._iter_moves(board, first_move))
+        deadline = time.time() + self.search_time * 0.95 - (time.perf_counter() - start_time)
+        pool = self._get_pool()
+        futures = [pool.submit(_search_root_moves, board, moves[i::self.workers], depth, alpha, beta,
+                               maximizing, deadline)
+                   for i in range(min(self.workers, len(moves)))]
+
+        best_value = -1000000 if maximizing else 1000000
+        best_move = None
+        for future in futures:
+            value, move, nodes, aborted = future.result()
+            self.nodes_searched += nodes
+            self.search_aborted = self.search_aborted or aborted
+            if move is not None and (value > best_value if maximizing else value < best_value):
+                best_value, best_move = value, move
+        if self.search_aborted:
+            # Some workers did not finish their moves; keep the previous depth's result
+            return best_value, None
+        return best_value, best_move
 
     def evaluate_position(self, board: chess.Board) -> int:
         """
@@ -139,74 +565,139 @@ class Strategy(StrategyBase):
         :return: Position score (positive favors White, negative favors Black)
         :rtype: int
         """
-        if board.is_checkmate():
-            return -20000 if board.turn else 20000
-
-        if board.is_stalemate() or board.is_insufficient_material():
-            return 0
+        key = position_key(board)
+        cache = self.eval_cache
+        score = cache.get(key)
+        if score is not None:
+            return score
 
-        score = 0
-
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece is None:
-                continue
-
-            # Get piece symbol
-            piece_symbol = piece.symbol()
-
-            # Material value
-            score += PIECE_VALUES.get(piece_symbol, 0)
-
-            # Positional bonus
-            piece_type = piece_symbol.upper()
-            if piece_type in PIECE_SQUARE_TABLES:
-                table = PIECE_SQUARE_TABLES[piece_type]
-                # chess library uses 0=a1, 63=h8. We need to convert to our table format
-                # Our tables are indexed rank 8 (index 0) to rank 1 (index 7), files a-h
-                rank = chess.square_rank(square)
-                file = chess.square_file(square)
-
-                if piece.color == chess.WHITE:
-                    # White: flip rank (rank 0 in chess lib = rank 1 in our table = index 7)
-                    table_idx = (7 - rank) * 8 + file
-                    score += table[table_idx]
-                else:
-                    # Black: use rank as-is (rank 0 = rank 1 = index 7, which we then flip)
-                    table_idx = rank * 8 + file
-                    score -= table[table_idx]
+        if board.is_checkmate():
+            score = -20000 if board.turn else 20000
+        elif board.is_stalemate() or board.is_insufficient_material():
+            score = 0
+        elif isinstance(board, EvalBoard):
+            # Material and positional bonus; the search board tracks it as moves are made
+            score = board.score
+        else:
+            score = material_score(board)
 
+        if len(cache) >= EVAL_CACHE_SIZE:
+            cache.clear()
+        cache[key] = score
         return score
 
-    def _order_moves(self, board: chess.Board, moves: List[chess.Move]) -> List[chess.Move]:
+    def _order_moves(self, board: chess.Board, moves: List[chess.Move],
+                     tt_move: Optional[chess.Move] = None, ply: int = 0) -> List[chess.Move]:
         """
         Order moves for better alpha-beta pruning using board state.
 
+        The hash move (the best move stored for this position by an earlier, shallower
+        search) goes first, followed by promotions, captures, killer moves and the remaining
+        moves. Captures are sorted most valuable victim first, then least valuable attacker
+        (MVV-LVA); the remaining quiet moves by their history score. Only cheap move
+        attributes and bitboard tests are used, no gives_check().
+
         :param board: Current board position
         :type board: chess.Board
         :param moves: List of legal moves
         :type moves: List[chess.Move]
+        :param tt_move: Best move from the transposition table, if any
+        :type tt_move: Optional[chess.Move]
+        :param ply: Distance from the root, selecting the killer moves
+        :type ply: int
         :return: Ordered list of moves
         :rtype: List[chess.Move]
         """
-        captures = []
-        checks = []
+        first = []
+        promotions = []
+        captures: List[Tuple[int, chess.Move]] = []
+        killers = self.killers[ply] if ply < MAX_PLY else [None, None]
+        killer_moves: List[Optional[chess.Move]] = [None, None]
         other_moves = []
 
         for move in moves:
+            if move == tt_move:
+                first.append(move)
+            elif move.promotion is not None:
+                promotions.append(move)
             # Prioritize captures
-            if board.is_capture(move):
-                captures.append(move)
-            # Then checks
-            elif board.gives_check(move):
-                checks.append(move)
+            elif board.is_capture(move):
+                # An en passant capture has no piece on the target square
+                victim = board.piece_type_at(move.to_square) or chess.PAWN
+                attacker = board.piece_type_at(move.from_square) or chess.PAWN
+                captures.append((10 * MATERIAL[victim] - MATERIAL[attacker], move))
+            # Then quiet moves that caused cutoffs at this ply in sibling positions
+            elif move == killers[0]:
+                killer_moves[0] = move
+            elif move == killers[1]:
+                killer_moves[1] = move
             else:
                 other_moves.append(move)
 
-        return captures + checks + other_moves
+        captures.sort(key=itemgetter(0), reverse=True)
+        history = self.history
+        other_moves.sort(key=lambda move: history[move.from_square][move.to_square], reverse=True)
+        return (first + promotions + [move for _, move in captures]
+                + [move for move in killer_moves if move is not None] + other_moves)
+
+    def _iter_moves(self, board: chess.Board, tt_move: Optional[chess.Move] = None,
+                    ply: int = 0) -> Iterator[chess.Move]:
+        """
+        Yield the legal moves in search order, generating them in stages.
+
+        The hash move is tried before any move generation, then the captures, then the
+        remaining moves, each stage ordered by _order_moves. When a cutoff happens early the
+        later stages are never generated. The board must be back in this position whenever
+        the next move is requested.
+
+        :param board: Current board position
+        :type board: chess.Board
+        :param tt_move: Best move from the transposition table, if any
+        :type tt_move: Optional[chess.Move]
+        :param ply: Distance from the root, used to look up killer moves
+        :type ply: int
+        :return: Iterator over the legal moves
+        :rtype: Iterator[chess.Move]
+        """
+        if tt_move is not None and board.is_legal(tt_move):
+            yield tt_move
+
+        captures = [move for move in board.generate_legal_captures() if move != tt_move]
+        yield from self._order_moves(board, captures, ply=ply)
+
+        # En passant lands on an empty square but was already generated as a capture.
+        # Castling is checked against the rook's (occupied) square, so the empty-square
+        # mask never yields it and it is generated separately
+        ep_square = board.ep_square
+        quiet_moves = [move for move in board.generate_legal_moves(to_mask=~board.occupied & chess.BB_ALL)
+                       if move != tt_move and not (move.to_square == ep_square and board.is_en_passant(move))]
+        quiet_moves.extend(move for move in board.generate_castling_moves() if move != tt_move)
+        yield from self._order_moves(board, quiet_moves, ply=ply)
+
+    def _record_cutoff(self, board: chess.Board, move: chess.Move, depth: int, ply: int) -> None:
+        """
+        Remember a quiet move that caused a cutoff as a killer and in the history table.
+
+        :param board: Position the move was played from
+        :type board: chess.Board
+        :param move: Move that caused the cutoff
+        :type move: chess.Move
+        :param depth: Remaining search depth at the cutoff
+        :type depth: int
+        :param ply: Distance from the root
+        :type ply: int
+        """
+        if board.is_capture(move):
+            return
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if move != killers[0]:
+                killers[1] = killers[0]
+                killers[0] = move
+        self.history[move.from_square][move.to_square] += depth * depth
 
     def minimax(self, board: chess.Board, depth: int, alpha: int, beta: int,
-                maximizing: bool, start_time: float) -> Tuple[int, Optional[chess.Move]]:
+                maximizing: bool, start_time: float, ply: int = 0) -> Tuple[int, Optional[chess.Move]]:
         """
         Minimax search with alpha-beta pruning using local board simulation.
 
@@ -220,37 +711,87 @@ class Strategy(StrategyBase):
         :type beta: int
         :param maximizing: True if maximizing player's turn
         :type maximizing: bool
-        :param start_time: Search start timestamp for time management
+        :param start_time: Search start time from time.perf_counter()
         :type start_time: float
+        :param ply: Distance from the root of the search
+        :type ply: int
         :return: Tuple of (evaluation, best_move)
         :rtype: Tuple[int, Optional[chess.Move]]
         """
         self.nodes_searched += 1
 
-        # Time check
-        if time.time() - start_time > self.search_time * 0.95:
+        # Time check, reading the clock only every 128 nodes; once time is up
+        # every remaining node returns straight away
+        if not self.nodes_searched & TIME_CHECK_MASK and time.perf_counter() - start_time > self.search_time * 0.95:
+            self.search_aborted = True
+        if self.search_aborted:
             return self.evaluate_position(board), None
 
-        # Base case: depth 0 or game over
-        if depth == 0 or board.is_game_over():
+        # Base case: game over, or depth 0 where only captures are searched further
+        if board.is_game_over():
             return self.evaluate_position(board), None
-
-        legal_moves = list(board.legal_moves)
-        if not legal_moves:
-            return self.evaluate_position(board), None
-
-        # Order moves by heuristics (captures, checks, center control)
-        ordered_moves = self._order_moves(board, legal_moves)
+        if depth == 0:
+            return self.quiesce(board, alpha, beta, start_time), None
+
+        # Probe the transposition table; an entry from an equal or deeper search either
+        # answers directly or narrows the window
+        alpha_orig, beta_orig = alpha, beta
+        key = position_key(board)
+        entry = self._probe(key)
+        tt_move = None
+        if entry is not None:
+            tt_depth, tt_value, tt_flag, tt_move = entry
+            if tt_depth >= depth:
+                if tt_flag == TT_EXACT:
+                    return tt_value, tt_move
+                if tt_flag == TT_LOWER:
+                    alpha = max(alpha, tt_value)
+                else:
+                    beta = min(beta, tt_value)
+                if beta <= alpha:
+                    return tt_value, tt_move
+
+        # Null-move pruning: let the opponent move twice in a row with a reduced search.
+        # If our position still holds the bound, a real move would too, so the node is
+        # cut without searching its moves. Not at the root, in check, right after another
+        # null move, or without pieces (zugzwang)
+        if (depth >= 3 and ply > 0 and board.move_stack and board.move_stack[-1]
+                and not board.is_check() and has_non_pawn_material(board)):
+            board.push(chess.Move.null())
+            if maximizing:
+                score, _ = self.minimax(board, depth - 1 - NULL_MOVE_REDUCTION, beta - 1, beta,
+                                        False, start_time, ply + 1)
+            else:
+                score, _ = self.minimax(board, depth - 1 - NULL_MOVE_REDUCTION, alpha, alpha + 1,
+                                        True, start_time, ply + 1)
+            board.pop()
+            if maximizing and score >= beta:
+                return beta, None
+            if not maximizing and score <= alpha:
+                return alpha, None
+
+        # Moves come in heuristic order, the table's best move from an earlier search
+        # first. Iterative deepening stores each depth's principal variation in the table,
+        # so the next depth starts down the same line
+        ordered_moves = self._iter_moves(board, tt_move, ply)
         best_move = None
 
         if maximizing:
             max_eval = -1000000
-            for move in ordered_moves:
+            for move_idx, move in enumerate(ordered_moves):
+                reduce = self._can_reduce(board, move, move_idx, depth)
+
                 # Make move
                 board.push(move)
 
-                # Recurse
-                eval_score, _ = self.minimax(board, depth - 1, alpha, beta, False, start_time)
+                # Recurse; a late quiet move is first searched one ply shallower and only
+                # re-searched at full depth if it looks better than alpha
+                if reduce and not board.is_check():
+                    eval_score, _ = self.minimax(board, depth - 2, alpha, beta, False, start_time, ply + 1)
+                    if eval_score > alpha:
+                        eval_score, _ = self.minimax(board, depth - 1, alpha, beta, False, start_time, ply + 1)
+                else:
+                    eval_score, _ = self.minimax(board, depth - 1, alpha, beta, False, start_time, ply + 1)
 
                 # Undo move
                 board.pop()
@@ -261,17 +802,31 @@ class Strategy(StrategyBase):
 
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(board, move, depth, ply)
                     break  # Beta cutoff
 
+            self._store(key, depth, max_eval, alpha_orig, beta_orig, best_move)
+            if self.search_aborted and ply == 0:
+                # Not every root move was searched, so this move may be worse than the
+                # previous depth's; return none, as _search_root_parallel does
+                return max_eval, None
             return max_eval, best_move
         else:
             min_eval = 1000000
-            for move in ordered_moves:
+            for move_idx, move in enumerate(ordered_moves):
+                reduce = self._can_reduce(board, move, move_idx, depth)
+
                 # Make move
                 board.push(move)
 
-                # Recurse
-                eval_score, _ = self.minimax(board, depth - 1, alpha, beta, True, start_time)
+                # Recurse; a late quiet move is first searched one ply shallower and only
+                # re-searched at full depth if it looks better than beta
+                if reduce and not board.is_check():
+                    eval_score, _ = self.minimax(board, depth - 2, alpha, beta, True, start_time, ply + 1)
+                    if eval_score < beta:
+                        eval_score, _ = self.minimax(board, depth - 1, alpha, beta, True, start_time, ply + 1)
+                else:
+                    eval_score, _ = self.minimax(board, depth - 1, alpha, beta, True, start_time, ply + 1)
 
                 # Undo move
                 board.pop()
@@ -282,10 +837,159 @@ class Strategy(StrategyBase):
 
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(board, move, depth, ply)
                     break  # Alpha cutoff
 
+            self._store(key, depth, min_eval, alpha_orig, beta_orig, best_move)
+            if self.search_aborted and ply == 0:
+                # Not every root move was searched, so this move may be worse than the
+                # previous depth's; return none, as _search_root_parallel does
+                return min_eval, None
             return min_eval, best_move
 
+    @staticmethod
+    def _can_reduce(board: chess.Board, move: chess.Move, move_idx: int, depth: int) -> bool:
+        """
+        Check whether a move qualifies for a late move reduction.
+
+        Moves ordered after the first few are rarely best, so quiet ones are searched a
+        ply shallower first. Captures and promotions are never reduced; the caller also
+        skips moves that give check.
+
+        :param board: Position before the move
+        :type board: chess.Board
+        :param move: Move about to be searched
+        :type move: chess.Move
+        :param move_idx: Position of the move in the ordered move list
+        :type move_idx: int
+        :param depth: Remaining search depth
+        :type depth: int
+        :return: True if the move may be searched at reduced depth
+        :rtype: bool
+        """
+        return move_idx >= 3 and depth >= 3 and move.promotion is None and not board.is_capture(move)
+
+    def quiesce(self, board: chess.Board, alpha: int, beta: int, start_time: float) -> int:
+        """
+        Search captures only until the position is quiet, then evaluate it.
+
+        Stops the search from evaluating in the middle of an exchange (the horizon
+        effect). The side to move may always "stand pat" on the static evaluation
+        instead of capturing.
+
+        :param board: Current board position
+        :type board: chess.Board
+        :param alpha: Alpha value for pruning
+        :type alpha: int
+        :param beta: Beta value for pruning
+        :type beta: int
+        :param start_time: Search start time from time.perf_counter()
+        :type start_time: float
+        :return: Evaluation (positive favors White)
+        :rtype: int
+        """
+        self.nodes_searched += 1
+        stand_pat = self.evaluate_position(board)
+
+        # Time check
+        if not self.nodes_searched & TIME_CHECK_MASK and time.perf_counter() - start_time > self.search_time * 0.95:
+            self.search_aborted = True
+        if self.search_aborted:
+            return stand_pat
+
+        maximizing = board.turn == chess.WHITE
+        if maximizing:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+
+        best = stand_pat
+        captures = list(board.generate_legal_captures())
+        for move in self._order_moves(board, captures):
+            board.push(move)
+            score = self.quiesce(board, alpha, beta, start_time)
+            board.pop()
+
+            if maximizing:
+                if score > best:
+                    best = score
+                alpha = max(alpha, score)
+            else:
+                if score < best:
+                    best = score
+                beta = min(beta, score)
+            if beta <= alpha:
+                break
+
+        return best
+
+    def _probe(self, key: int) -> Optional[Tuple[int, int, int, Optional[chess.Move]]]:
+        """
+        Look up a position in the transposition table.
+
+        :param key: Position hash from position_key()
+        :type key: int
+        :return: Tuple of (depth, value, flag, best move), or None if the position is not stored
+        :rtype: Optional[Tuple[int, int, int, Optional[chess.Move]]]
+        """
+        index = key & TT_MASK
+        if self.tt_keys[index] != key:
+            return None
+        data = self.tt_data[index]
+        move_code = data & 0x7FFF
+        best_move = None
+        if move_code:
+            best_move = chess.Move(move_code & 63, (move_code >> 6) & 63, (move_code >> 12) or None)
+        return (data >> 17) & 63, data >> 23, (data >> 15) & 3, best_move
+
+    def _store(self, key: int, depth: int, value: int, alpha: int, beta: int,
+               best_move: Optional[chess.Move]) -> None:
+        """
+        Record a search result in the transposition table.
+
+        The entry is packed into one int: the value from bit 23 up (keeping its sign),
+        the depth in bits 17-22, the flag in bits 15-16 and the best move's from square,
+        to square and promotion piece in bits 0-14 (all zero for no move).
+
+        :param key: Position hash from position_key()
+        :type key: int
+        :param depth: Depth the position was searched to
+        :type depth: int
+        :param value: Search result
+        :type value: int
+        :param alpha: Alpha bound the search was started with
+        :type alpha: int
+        :param beta: Beta bound the search was started with
+        :type beta: int
+        :param best_move: Best move found, if any
+        :type best_move: Optional[chess.Move]
+        """
+        # Values from a search cut short by the clock are not reliable
+        if self.search_aborted:
+            return
+
+        # Depth-preferred replacement: keep a deeper result for the same position, but let
+        # a different position take over the slot
+        index = key & TT_MASK
+        if self.tt_keys[index] == key and (self.tt_data[index] >> 17) & 63 > depth:
+            return
+
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        move_code = 0
+        if best_move is not None:
+            move_code = best_move.from_square | best_move.to_square << 6 | (best_move.promotion or 0) << 12
+        self.tt_keys[index] = key
+        self.tt_data[index] = value << 23 | depth << 17 | flag << 15 | move_code
+
     def choose_move(self, board: chess.Board, legal_moves: List[str], player_color: str) -> str:
         """
         Choose the best move using iterative deepening with minimax search.
@@ -306,36 +1010,67 @@ class Strategy(StrategyBase):
         if len(legal_moves) == 1:
             return legal_moves[0]
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         best_move_san = legal_moves[0]
         self.nodes_searched = 0
+        # A stop requested before this search started still applies
+        self.search_aborted = self._stop_requested
+        # Killers are specific to this search; history is halved so older cutoffs fade
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        for row in self.history:
+            row[:] = [score >> 1 for score in row]
 
         maximizing = player_color == 'white'
+        last_score = 0
+        # minimax undoes every move it makes, so one search board serves all depths
+        search_board = EvalBoard.from_board(board)
+        best_move_obj: Optional[chess.Move] = None
 
         # Iterative deepening
         for depth in range(1, 20):
-            if time.time() - start_time > self.search_time * 0.9:
+            if self.search_aborted or time.perf_counter() - start_time > self.search_time * 0.9:
                 break
 
             try:
-                # Copy board for this depth's search
-                search_board = board.copy()
-
-                # Run minimax search
-                eval_score, best_move_obj = self.minimax(
-                    search_board,
-                    depth,
-                    -1000000,
-                    1000000,
-                    maximizing,
-                    start_time
-                )
+                # Search a narrow window around the previous score first; if the result
+                # falls outside it, open that side fully and search again
+                alpha, beta = -1000000, 1000000
+                if depth > 1:
+                    alpha, beta = last_score - ASPIRATION_WINDOW, last_score + ASPIRATION_WINDOW
+
+                while True:
+                    if self.workers > 1:
+                        eval_score, move = self._search_root_parallel(
+                            search_board, depth, alpha, beta, maximizing, start_time, best_move_obj)
+                    else:
+                        eval_score, move = self.minimax(
+                            search_board,
+                            depth,
+                            alpha,
+                            beta,
+                            maximizing,
+                            start_time
+                        )
+                    if self.search_aborted:
+                        break
+                    if eval_score <= alpha:
+                        alpha = -1000000
+                    elif eval_score >= beta:
+                        beta = 1000000
+                    else:
+                        break
+                if self.search_aborted:
+                    # Time ran out before this depth finished, possibly with only a bound from
+                    # the narrow window; keep the previous depth's move and score
+                    break
+                last_score = eval_score
+                best_move_obj = move
 
                 if best_move_obj is not None:
                     # Convert chess.Move to SAN for server
                     best_move_san = board.san(best_move_obj)
 
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 console.print(
                     f"[dim]Depth {depth}:[/dim] {self.nodes_searched} nodes, {elapsed:.2f}s, "
                     f"eval={eval_score}, best=[cyan]{best_move_san}[/cyan]"
@@ -7,7 +7,7 @@ to create their own chess AI.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Optional, Union
 
 import chess
 
@@ -24,22 +24,77 @@ class StrategyBase(ABC):
     :type search_time: float
     """
 
+    # Notation for legal_moves and the returned move: "san" (default), "uci" or "move"
+    # (chess.Move objects). UCI strings and Move objects are cheaper to generate than SAN,
+    # which must disambiguate every move; the client converts the chosen move back to SAN
+    # before sending it to the server.
+    move_notation: str = "san"
+
     def __init__(self, search_time: float):
         self.search_time = search_time
 
+    def warmup(self) -> None:
+        """
+        Prepare the strategy before its first move (optional).
+
+        Called once in a worker thread while the client connects and waits for a match, so
+        expensive setup such as loading an opening book or model does not count
+        against the first move's search time. The default does nothing.
+        """
+        pass
+
+    def get_transposition_table(self) -> Optional[bytes]:
+        """
+        Serialize the strategy's transposition table for reuse in a later game (optional).
+
+        Called in the strategy thread after a game ends when the client was given a
+        transposition table file. The default returns None, which saves nothing.
+
+        :return: Serialized table, or None if there is nothing to save
+        :rtype: Optional[bytes]
+        """
+        return None
+
+    def set_transposition_table(self, data: bytes) -> None:
+        """
+        Restore a transposition table saved by get_transposition_table() (optional).
+
+        Called in the strategy thread before warmup() when the transposition table
+        file exists. The default ignores the data.
+
+        :param data: Serialized table from a previous game
+        :type data: bytes
+        """
+        pass
+
+    def stop(self) -> None:
+        """
+        Ask a running choose_move() to return as soon as it can (optional).
+
+        Called from the event loop thread when the client shuts down, possibly while a
+        search is running in the strategy thread. The process cannot exit until that
+        search returns, so long searches should check for this request. The default does
+        nothing.
+        """
+        pass
+
     @abstractmethod
-    def choose_move(self, board: chess.Board, legal_moves: List[str], player_color: str) -> str:
+    def choose_move(self, board: chess.Board, legal_moves: List[Any],
+                    player_color: str) -> Union[str, chess.Move]:
         """
         Choose the best move for the current position.
 
         :param board: Current board position (python-chess Board object)
         :type board: chess.Board
-        :param legal_moves: List of legal moves in SAN notation (e.g., ["e4", "Nf3"])
-        :type legal_moves: List[str]
+        :param legal_moves: List of legal moves in SAN notation (e.g., ["e4", "Nf3"]),
+            UCI notation (e.g., ["e2e4", "g1f3"]) when move_notation is "uci", or
+            chess.Move objects when move_notation is "move". Generated once per turn by the
+            client; reuse it instead of board.legal_moves, and do not modify it
+        :type legal_moves: List[Any]
         :param player_color: Color of the player ("white" or "black")
         :type player_color: str
-        :return: Selected move in SAN notation
-        :rtype: str
+        :return: Selected move in the same notation as legal_moves
+        :rtype: Union[str, chess.Move]
         :raises Exception: If no legal moves available or move selection fails
         """
         pass
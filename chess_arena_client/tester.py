@@ -8,12 +8,16 @@ Results are displayed with color-coded pass/fail indicators and running counts.
 """
 
 import argparse
-import json
+import functools
+import importlib.util
+import random
 import sys
+import time
 from pathlib import Path
-from typing import List
+from typing import Any, Iterator, List, Tuple
 
 import chess
+import orjson
 from rich.console import Console
 
 from chess_arena_client.strategy_base import StrategyBase
@@ -21,6 +25,41 @@ from chess_arena_client.strategy_base import StrategyBase
 console = Console()
 
 
+def _read_lines(file_path: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield the non-empty lines of a JSONL file, unparsed, with their line numbers.
+
+    :param file_path: Path to the JSONL file
+    :type file_path: str
+    :return: Iterator of (line number, stripped line) pairs
+    :rtype: Iterator[Tuple[int, Any]]
+    """
+    with open(file_path, 'rb') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if line:  # Skip empty lines
+                yield line_num, line
+
+
+def _parse_test_case(line_num: int, line: Any) -> dict:
+    """
+    Parse one JSONL line into a test case.
+
+    :param line_num: Line number, for the error message
+    :type line_num: int
+    :param line: Line content
+    :type line: Any
+    :return: Test case
+    :rtype: dict
+    :raises orjson.JSONDecodeError: If JSON is malformed
+    """
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        console.print(f"[red]✗ Error parsing JSON on line {line_num}:[/red] {e}")
+        raise
+
+
 def load_test_data(file_path: str) -> List[dict]:
     """
     Load test data from JSONL file.
@@ -30,21 +69,48 @@ def load_test_data(file_path: str) -> List[dict]:
     :return: List of test cases
     :rtype: List[dict]
     :raises FileNotFoundError: If test data file is not found
-    :raises json.JSONDecodeError: If JSON is malformed
+    :raises orjson.JSONDecodeError: If JSON is malformed
+    """
+    try:
+        # One read and split, then parse every non-empty line in a single comprehension
+        with open(file_path, 'rb') as f:
+            lines = f.read().split(b'\n')
+        return [_parse_test_case(line_num, line) for line_num, line in enumerate(lines, 1) if line.strip()]
+    except FileNotFoundError:
+        console.print(f"[red]✗ Test data file not found:[/red] {file_path}")
+        raise
+    except Exception as e:
+        console.print(f"[red]✗ Error reading test data file:[/red] {e}")
+        raise
+
+
+def sample_test_data(file_path: str, sample_size: int) -> Tuple[List[dict], int]:
+    """
+    Load a random sample of test cases from a JSONL file in a single pass.
+
+    Uses reservoir sampling, so only the chosen lines are parsed and kept in memory.
+
+    :param file_path: Path to the JSONL file
+    :type file_path: str
+    :param sample_size: Number of test cases to pick
+    :type sample_size: int
+    :return: Tuple of (sampled test cases, total number of test cases in the file)
+    :rtype: Tuple[List[dict], int]
+    :raises FileNotFoundError: If test data file is not found
+    :raises orjson.JSONDecodeError: If a sampled line is malformed
     """
-    test_cases = []
+    reservoir: List[Tuple[int, Any]] = []
+    total = 0
     try:
-        with open(file_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        test_case = json.loads(line)
-                        test_cases.append(test_case)
-                    except json.JSONDecodeError as e:
-                        console.print(f"[red]✗ Error parsing JSON on line {line_num}:[/red] {e}")
-                        raise
-        return test_cases
+        for total, entry in enumerate(_read_lines(file_path), 1):
+            if total <= sample_size:
+                reservoir.append(entry)
+            else:
+                # Keep the new line with probability sample_size / total
+                slot = random.randrange(total)
+                if slot < sample_size:
+                    reservoir[slot] = entry
+        return [_parse_test_case(line_num, line) for line_num, line in reservoir], total
     except FileNotFoundError:
         console.print(f"[red]✗ Test data file not found:[/red] {file_path}")
         raise
@@ -53,6 +119,21 @@ def load_test_data(file_path: str) -> List[dict]:
         raise
 
 
+@functools.lru_cache(maxsize=1024)
+def _board_from_fen(fen: str) -> chess.Board:
+    """
+    Parse a FEN once and reuse the board for test cases sharing the same position.
+
+    Callers must copy the returned board before handing it to a strategy.
+
+    :param fen: FEN string
+    :type fen: str
+    :return: Board for the FEN
+    :rtype: chess.Board
+    """
+    return chess.Board(fen)
+
+
 def load_strategy_from_file(file_path: str) -> StrategyBase:
     """
     Dynamically load a Strategy class from a Python file.
@@ -64,8 +145,6 @@ def load_strategy_from_file(file_path: str) -> StrategyBase:
     :raises ImportError: If the strategy file cannot be loaded
     :raises AttributeError: If the Strategy class is not found
     """
-    import importlib.util
-
     try:
         spec = importlib.util.spec_from_file_location("strategy_module", file_path)
         if spec is None or spec.loader is None:
@@ -110,20 +189,24 @@ def run_test_case(strategy: StrategyBase, test_case: dict, test_index: int,
     :return: Tuple of (test_passed, timeout_occurred)
     :rtype: tuple[bool, bool]
     """
-    import time
-
     try:
         fen = test_case["fen"]
         legal_moves = test_case["legal_moves"]
         player_color = test_case["player_color"]
 
-        # Create board from FEN
-        board = chess.Board(fen)
+        # Copy a cached board so repeated FENs are only parsed once
+        board = _board_from_fen(fen).copy()
+
+        # Test data stores SAN; hand UCI and Move strategies the equivalent moves
+        if strategy.move_notation == "uci":
+            legal_moves = [board.parse_san(move).uci() for move in legal_moves]
+        elif strategy.move_notation == "move":
+            legal_moves = [board.parse_san(move) for move in legal_moves]
 
         # Call strategy to choose a move with timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         chosen_move = strategy.choose_move(board, legal_moves, player_color)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         # Check if move took too long (with small buffer to account for system timing)
         timeout_occurred = elapsed_time > (strategy.search_time + 0.1)
@@ -238,26 +321,25 @@ def main() -> None:
         console.print("[yellow]Please ensure test_data/game_states.jsonl exists.[/yellow]")
         sys.exit(1)
 
+    if args.sample is not None and args.sample < 1:
+        console.print("[red]✗ Sample size must be at least 1[/red]")
+        sys.exit(1)
+
     try:
-        test_cases = load_test_data(str(test_data_path))
-        console.print(f"[cyan]Loaded {len(test_cases)} test cases[/cyan]")
-
-        # Store original count for display
-        original_total = len(test_cases)
-
-        # Sample tests if requested
-        if args.sample is not None:
-            import random
-            if args.sample < 1:
-                console.print("[red]✗ Sample size must be at least 1[/red]")
-                sys.exit(1)
-            if args.sample < len(test_cases):
-                test_cases = random.sample(test_cases, args.sample)
+        if args.sample is None:
+            test_cases = load_test_data(str(test_data_path))
+            original_total = len(test_cases)
+            console.print(f"[cyan]Loaded {original_total} test cases[/cyan]")
+        else:
+            # Sample while reading, parsing only the test cases that will run
+            test_cases, original_total = sample_test_data(str(test_data_path), args.sample)
+            console.print(f"[cyan]Found {original_total} test cases[/cyan]")
+            if args.sample < original_total:
                 console.print(f"[cyan]Sampled {len(test_cases)} test cases[/cyan]")
             else:
                 console.print(
                     f"[yellow]Sample size ({args.sample}) is greater than or equal to "
-                    f"total tests ({len(test_cases)}), running all tests[/yellow]")
+                    f"total tests ({original_total}), running all tests[/yellow]")
     except Exception:
         sys.exit(1)
 
@@ -269,6 +351,8 @@ def main() -> None:
         strategy = load_strategy_from_file(args.strategy)
         # Set the search time for the strategy
         strategy.search_time = args.search_time
+        # Warm up before timing so the first test case is not charged for setup
+        strategy.warmup()
         console.print("[green]✓ Strategy loaded successfully[/green]")
     except Exception:
         sys.exit(1)
@@ -295,7 +379,6 @@ def main() -> None:
         console.print(f"[cyan]Passed:[/cyan] {passed}/{total}")
 
     # Write test results to JSON file
-    import json
     failed = total - passed
     test_results = {
         "passed": passed,
@@ -312,8 +395,7 @@ def main() -> None:
         test_results["sampled"] = False
 
     try:
-        with open("test_result.json", "w") as f:
-            json.dump(test_results, f, indent=2)
+        Path("test_result.json").write_bytes(orjson.dumps(test_results, option=orjson.OPT_INDENT_2))
         console.print("[green]✓[/green] Test results written to test_result.json")
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to write test results to JSON file: {e}")
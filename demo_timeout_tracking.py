@@ -11,31 +11,39 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 class DemoStrategy(StrategyBase):
     def choose_move(self, board, legal_moves, player_color):
-        # Always choose the first legal move for testing
-        return legal_moves[0] if legal_moves else None
+        # Always choose the first legal move for testing; the try costs nothing when
+        # there is one
+        try:
+            return legal_moves[0]
+        except IndexError:
+            return None
 
 
 # Demo the game results functionality with timeout tracking
 if __name__ == "__main__":
-    # Create a demo client with the store_result_file parameter
+    # Create a demo client with the store_result_file parameter; the three simulated
+    # games below are written to the file together
     strategy = DemoStrategy(search_time=1.0)
     client = ChessClient(
         server_url="http://localhost:9002",
         strategy=strategy,
-        store_result_file="demo_results.json"
+        store_result_file="demo_results.json",
+        results_batch_size=3
     )
 
     print("=== Chess Arena Client - Game Results with Timeout Tracking ===\n")
 
     # Show initial results
-    print("Initial game results:")
     initial_results = client.load_game_results()
-    print(f"Wins: {initial_results.get('wins', 0)}")
-    print(f"Losses: {initial_results.get('losses', 0)}")
-    print(f"Draws: {initial_results.get('draws', 0)}")
-    print(f"Timeouts: {initial_results.get('timeouts', 0)}")
-    print(f"Games played: {len(initial_results.get('game_ids', []))}")
-    print(f"Game IDs: {initial_results.get('game_ids', [])}\n")
+    print("\n".join((
+        "Initial game results:",
+        f"Wins: {initial_results.get('wins', 0)}",
+        f"Losses: {initial_results.get('losses', 0)}",
+        f"Draws: {initial_results.get('draws', 0)}",
+        f"Timeouts: {initial_results.get('timeouts', 0)}",
+        f"Games played: {len(initial_results.get('game_ids', []))}",
+        f"Game IDs: {initial_results.get('game_ids', [])}\n",
+    )))
 
     # Simulate a normal win
     print("Simulating a normal win...")
@@ -68,18 +76,20 @@ if __name__ == "__main__":
         f"{results.get('draws', 0)} draws, {results.get('timeouts', 0)} timeouts\n")
 
     # Final summary
-    print("=== Final Results ===")
     final_results = client.load_game_results()
-    print(f"Wins: {final_results.get('wins', 0)}")
-    print(f"Losses: {final_results.get('losses', 0)}")
-    print(f"Draws: {final_results.get('draws', 0)}")
-    print(f"Timeouts: {final_results.get('timeouts', 0)}")
     win_rate = (final_results.get('wins', 0) /
                 max(1, final_results.get('wins', 0) + final_results.get('losses', 0) +
                     final_results.get('draws', 0)) * 100)
-    print(f"Win rate: {win_rate:.1f}%")
     timeout_rate = (final_results.get('timeouts', 0) /
                     max(1, final_results.get('losses', 0)) * 100)
-    print(f"Timeout rate: {timeout_rate:.1f}% of losses")
-    print(f"Total games: {len(final_results.get('game_ids', []))}")
-    print(f"Game IDs: {final_results.get('game_ids', [])}")
+    print("\n".join((
+        "=== Final Results ===",
+        f"Wins: {final_results.get('wins', 0)}",
+        f"Losses: {final_results.get('losses', 0)}",
+        f"Draws: {final_results.get('draws', 0)}",
+        f"Timeouts: {final_results.get('timeouts', 0)}",
+        f"Win rate: {win_rate:.1f}%",
+        f"Timeout rate: {timeout_rate:.1f}% of losses",
+        f"Total games: {len(final_results.get('game_ids', []))}",
+        f"Game IDs: {final_results.get('game_ids', [])}",
+    )))
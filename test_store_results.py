@@ -11,8 +11,12 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 class TestStrategy(StrategyBase):
     def choose_move(self, board, legal_moves, player_color):
-        # Always choose the first legal move for testing
-        return legal_moves[0] if legal_moves else None
+        # Always choose the first legal move for testing; the try costs nothing when
+        # there is one
+        try:
+            return legal_moves[0]
+        except IndexError:
+            return None
 
 
 # Test the game results functionality
@@ -10,6 +10,12 @@ import chess
 
 from chess_arena_client.strategy_base import StrategyBase
 
+# Moves that mark the 20-move opening positions this strategy deliberately fails
+_OPENING_MOVES = frozenset(("e4", "d4"))
+
+# Private generator for picking moves, independent of the global random state
+_rng = random.Random()
+
 
 class Strategy(StrategyBase):
     """
@@ -20,9 +26,9 @@ class Strategy(StrategyBase):
     def choose_move(self, board: chess.Board, legal_moves: List[str], player_color: str) -> str:
         # For test indices 5, 10, 15, etc., return an invalid move to trigger FAIL output
         # We'll check the legal moves to determine which test this might be
-        if len(legal_moves) == 20 and "e4" in legal_moves and "d4" in legal_moves:
+        if len(legal_moves) == 20 and _OPENING_MOVES.issubset(legal_moves):
             # This looks like one of the early tests, let's fail it
             return "invalid_move"
 
         # For most tests, return a valid move
-        return random.choice(legal_moves)
+        return _rng.choice(legal_moves)
@@ -3,36 +3,64 @@
 Unit tests for the chess arena client main module.
 """
 
+import asyncio
+import json
 import os
 import sys
+import tempfile
 import unittest
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import chess
+import websockets.exceptions
 
 # Add the project root to the path so we can import the module
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-# Change to the project directory so relative imports work
-original_cwd = os.getcwd()
-os.chdir(project_root)
+from chess_arena_client.main import (ChessClient, board_pretty_print, get_latest_auth,  # noqa: E402
+                                     load_auth_from_file)
+from chess_arena_client.strategy_base import StrategyBase  # noqa: E402
+
+
+class DummyStrategy(StrategyBase):
+    """Strategy that always plays the first legal move."""
 
-try:
-    import chess
+    def choose_move(self, board, legal_moves, player_color):
+        return legal_moves[0]
 
-    from chess_arena_client.main import board_pretty_print, load_auth_from_file
-finally:
-    os.chdir(original_cwd)
+
+def _make_client(strategy=None, **kwargs):
+    """
+    Build a client for a local server address without connecting.
+
+    :param strategy: Strategy for the client (default: a DummyStrategy)
+    :type strategy: Optional[StrategyBase]
+    :param kwargs: Further ChessClient keyword arguments
+    :return: New client
+    :rtype: ChessClient
+    """
+    if strategy is None:
+        strategy = DummyStrategy(search_time=1.0)
+    return ChessClient(server_url="http://localhost:9002", strategy=strategy, **kwargs)
 
 
 class TestMain(unittest.TestCase):
     """Test cases for the main module."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the clients shared by the read-only initialization tests once."""
+        cls.client_normal = _make_client()
+        cls.client_aggressive = _make_client(aggressive_reconnect=True)
+
     def test_load_auth_from_file_success(self):
         """Test successful loading of auth data from file."""
-        mock_content = ('{"game_id": "game123", "player_id": "player456", '
-                        '"player_color": "white", "auth_token": "token789"}')
+        mock_content = (b'{"game_id": "game123", "player_id": "player456", '
+                        b'"player_color": "white", "auth_token": "token789"}')
 
-        with patch("builtins.open", unittest.mock.mock_open(read_data=mock_content)):
+        with patch("pathlib.Path.read_bytes", return_value=mock_content):
             result = load_auth_from_file("fake_path.json")
             self.assertIsNotNone(result)
             game_id, player_id, player_color, auth_token = result
@@ -43,18 +71,39 @@ class TestMain(unittest.TestCase):
 
     def test_load_auth_from_file_missing_fields(self):
         """Test loading auth data with missing fields."""
-        mock_content = '{"game_id": "game123", "player_id": "player456"}'
+        mock_content = b'{"game_id": "game123", "player_id": "player456"}'
 
-        with patch("builtins.open", unittest.mock.mock_open(read_data=mock_content)):
+        with patch("pathlib.Path.read_bytes", return_value=mock_content):
             result = load_auth_from_file("fake_path.json")
             self.assertIsNone(result)
 
+    def test_get_latest_auth_picks_newest_file(self):
+        """Test that the most recently modified legacy auth file is used."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_file = os.path.join(tmp_dir, ".oldplayer_game1_black_token1_auth")
+            new_file = os.path.join(tmp_dir, ".newplayer_game2_white_token2_auth")
+            # Newest of all, but not in the auth filename format
+            stray_file = os.path.join(tmp_dir, ".stray_auth")
+            for path, mtime in ((old_file, 1000), (new_file, 2000), (stray_file, 3000)):
+                open(path, "w").close()
+                os.utime(path, (mtime, mtime))
+
+            cwd = os.getcwd()
+            os.chdir(tmp_dir)
+            try:
+                result = get_latest_auth()
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(result, ("game2", "newplayer", "white", "token2"))
+
     def test_board_pretty_print(self):
         """Test board pretty printing doesn't crash."""
         board = chess.Board()
         # Just verify it doesn't raise an exception
         board_pretty_print(board)
 
+    @unittest.skip("placeholder - requires a mocked WebSocket connection")
     def test_health_check_attributes(self):
         """Test that health check attributes are properly initialized."""
         # We can't easily test the full ChessClient without a WebSocket server,
@@ -64,31 +113,343 @@ class TestMain(unittest.TestCase):
         # A more comprehensive test would require mocking the WebSocket connection
         pass
 
+    def test_aggressive_reconnect_default(self):
+        """Test that aggressive reconnect is disabled by default."""
+        self.assertFalse(self.client_normal.aggressive_reconnect)
+
     def test_aggressive_reconnect_initialization(self):
         """Test that aggressive reconnect can be enabled."""
-        from chess_arena_client.main import ChessClient
-        from chess_arena_client.strategy_base import StrategyBase
+        self.assertTrue(self.client_aggressive.aggressive_reconnect)
+
+    def test_receive_messages_routes_replies_to_waiters(self):
+        """Test that expected replies bypass the message queue."""
+        class FakeWebSocket:
+            def __init__(self, frames):
+                self.frames = list(frames)
+
+            async def recv(self, decode=None):
+                if not self.frames:
+                    raise websockets.exceptions.ConnectionClosedOK(None, None)
+                return self.frames.pop(0)
+
+        client = _make_client()
+        client.websocket = FakeWebSocket([
+            b'{"type":"ping"}',
+            b'{"type": "ping", "id": 7}',
+            b'{"type": "move_made", "fen": "8/8/8/8/8/8/8/8 w - - 0 1"}',
+            b'{"type": "board_state", "fen": "8/8/8/8/8/8/8/8 w - - 0 1", "current_turn": "white"}',
+        ])
+
+        async def scenario():
+            reply = client._expect_message("board_state", "error")
+            await client.receive_messages()
+            return await reply
+
+        reply = asyncio.run(scenario())
+        self.assertEqual(reply["type"], "board_state")
+        self.assertEqual(client.message_queue.qsize(), 2)
+        self.assertEqual(client.message_queue.get_nowait()[0], "move_made")
+        # The closed connection is signalled through the queue
+        self.assertEqual(client.message_queue.get_nowait(), (None, None))
+        self.assertEqual(client._waiters, {})
+        # Pings are answered directly and never queued
+        self.assertEqual(client._pending_send, [b'{"type":"pong"}', b'{"type":"pong"}'])
+
+    def test_save_auth_token_skips_unchanged_credentials(self):
+        """Test that the auth file is only rewritten when the credentials change."""
+        client = _make_client(auth_file="auth.json")
+        client.game_id, client.player_id, client.player_color, client.auth_token = "g1", "p1", "white", "t1"
+
+        with patch("chess_arena_client.main._atomic_write_json") as write_json:
+            asyncio.run(client.save_auth_token())
+            asyncio.run(client.save_auth_token())
+            client.auth_token = "t2"
+            asyncio.run(client.save_auth_token())
+
+        self.assertEqual(write_json.call_count, 2)
+        self.assertEqual(write_json.call_args[0][1]["auth_token"], "t2")
+
+    def test_update_game_results_reads_file_once(self):
+        """Test that results are loaded once, handed out as copies and merged into the file on save."""
+        stored = {"wins": 2, "losses": 0, "draws": 0, "timeouts": 0, "game_ids": ["g0", "g1", "g0"]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results_path = os.path.join(tmp_dir, "results.json")
+            with open(results_path, "w") as f:
+                json.dump(stored, f)
+            client = _make_client(store_result_file=results_path, results_batch_size=10)
+
+            with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes, \
+                    patch("chess_arena_client.main.atexit.register"):
+                self.assertEqual(client.load_game_results()["wins"], 2)
+                client.game_id = "g1"
+                client.update_game_results("win")
+                client.game_id = "g2"
+                client.update_game_results("loss", timeout_occurred=True)
+                client.update_game_results("draw")
+                # Callers get a copy; changing it does not touch the pending results
+                client.load_game_results()["wins"] = 100
+                results = client.load_game_results()
+
+            read_bytes.assert_called_once()
+            self.assertEqual((results["wins"], results["losses"], results["draws"], results["timeouts"]),
+                             (3, 1, 1, 1))
+            self.assertEqual(results["game_ids"], ["g0", "g1", "g2"])
+
+            # Another client sharing the file records a game before this one saves
+            with open(results_path, "w") as f:
+                json.dump({"wins": 5, "losses": 0, "draws": 0, "timeouts": 0, "game_ids": ["g0", "g1", "g9"]}, f)
+            client.flush_results()
+            with open(results_path) as f:
+                saved = json.load(f)
+
+        self.assertEqual((saved["wins"], saved["losses"], saved["draws"], saved["timeouts"]), (6, 1, 1, 1))
+        self.assertEqual(saved["game_ids"], ["g0", "g1", "g9", "g2"])
+        self.assertEqual(client.load_game_results(), saved)
+
+    def test_update_game_results_batches_writes(self):
+        """Test that results are written once per batch and pending updates stay readable."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            client = _make_client(store_result_file=os.path.join(tmp_dir, "results.json"), results_batch_size=2)
+
+            with patch.object(ChessClient, "save_game_results", autospec=True,
+                              side_effect=ChessClient.save_game_results) as save_results, \
+                    patch("chess_arena_client.main.atexit.register") as register:
+                client.game_id = "g1"
+                client.update_game_results("win")
+                save_results.assert_not_called()
+                register.assert_called_once_with(client.flush_results)
+                self.assertEqual(client.load_game_results()["wins"], 1)
+
+                client.game_id = "g2"
+                client.update_game_results("draw")
+                self.assertEqual(save_results.call_count, 1)
+
+                client.game_id = "g3"
+                client.update_game_results("loss")
+                client.flush_results()
+                client.flush_results()
+
+        self.assertEqual(save_results.call_count, 2)
+        self.assertEqual(save_results.call_args[0][1]["game_ids"], ["g1", "g2", "g3"])
+
+    def test_atomic_write_json_keeps_old_file_on_failure(self):
+        """Test that a failed write leaves the previous file and no temporary file."""
+        from chess_arena_client.main import _atomic_write_json
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "results.json")
+            _atomic_write_json(path, {"wins": 1})
+
+            with self.assertRaises(TypeError):
+                _atomic_write_json(path, {"wins": object()})
+
+            with open(path) as f:
+                self.assertEqual(f.read(), '{\n  "wins": 1\n}')
+            self.assertEqual(os.listdir(tmp_dir), ["results.json"])
+
+    def test_request_board_state_times_out(self):
+        """Test that an unanswered board sync fails instead of waiting forever."""
+        client = _make_client()
+        client.sync_timeout = 0.01
+
+        with self.assertRaises(Exception) as context:
+            asyncio.run(client._request_board_state())
+        self.assertIn("No board state received", str(context.exception))
+        self.assertEqual(client._waiters, {})
+
+    def test_run_stops_strategy_on_exit(self):
+        """Test that run() stops the strategy and releases its thread when the connection fails."""
+        class StoppableStrategy(DummyStrategy):
+            stopped = False
+
+            def stop(self):
+                self.stopped = True
+
+        client = _make_client(StoppableStrategy(search_time=1.0))
+        with patch.object(client, "_connect", side_effect=OSError("refused")):
+            asyncio.run(client.run())
+        self.assertTrue(client.strategy.stopped)
+        with self.assertRaises(RuntimeError):
+            client._strategy_executor.submit(print)
+
+    def test_pending_reply_fails_when_connection_closes(self):
+        """Test that a coroutine waiting for a reply is woken when the connection closes."""
+        class ClosedWebSocket:
+            async def recv(self, decode=None):
+                raise websockets.exceptions.ConnectionClosedOK(None, None)
+
+        client = _make_client()
+        client.websocket = ClosedWebSocket()
+
+        async def scenario():
+            reply = client._expect_message("match_found", "queue_timeout")
+            await client.receive_messages()
+            return await reply
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(scenario())
+        self.assertEqual(client._waiters, {})
+
+    def test_send_failure_closes_connection(self):
+        """Test that an unexpected send error closes the connection instead of stalling the queue."""
+        class BrokenWebSocket:
+            closed = False
+
+            async def send(self, frame, text=None):
+                raise ValueError("bad frame")
+
+            async def close(self):
+                self.closed = True
+
+        client = _make_client()
+        client.websocket = BrokenWebSocket()
+
+        async def scenario():
+            task = asyncio.create_task(client.flush_outgoing_messages())
+            await client.send_message({"type": "pong"})
+            await asyncio.wait_for(task, timeout=1.0)
+
+        asyncio.run(scenario())
+        self.assertTrue(client.websocket.closed)
+
+        # Frames still queued for the old connection are not replayed on the next one
+        client._pending_send.append(b'{"type": "make_move"}')
+        with patch("websockets.connect", AsyncMock(return_value=object())), \
+                patch.object(client, "_start_bg_tasks"):
+            asyncio.run(client._connect())
+        self.assertEqual(client._pending_send, [])
+
+    def test_handle_game_messages_stops_on_game_over_or_disconnect(self):
+        """Test that the game loop returns on game over and on a closed connection."""
+        client = _make_client()
+        client.player_color = "white"
+        # Fool's mate: white is checkmated
+        fen = "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3"
+        client.message_queue.put_nowait(("opponent_disconnected", {"type": "opponent_disconnected"}))
+        client.message_queue.put_nowait(("move_made", {"type": "move_made", "fen": fen, "game_over": True,
+                                                       "game_over_reason": "checkmate"}))
+        with patch.object(client, "update_game_results") as update_results:
+            self.assertTrue(asyncio.run(client._handle_game_messages(0, show_board=False)))
+        update_results.assert_called_once_with("loss", False)
+        self.assertEqual(client.local_board.fen(), fen)
+
+        client.message_queue.put_nowait((None, None))
+        self.assertFalse(asyncio.run(client._handle_game_messages(0, show_board=False)))
+
+    def test_play_one_move_with_move_objects(self):
+        """Test that a "move" notation strategy gets chess.Move objects and its pick is sent as SAN."""
+        class MoveStrategy(StrategyBase):
+            move_notation = "move"
 
-        class DummyStrategy(StrategyBase):
             def choose_move(self, board, legal_moves, player_color):
-                return legal_moves[0] if legal_moves else None
+                assert all(isinstance(move, chess.Move) for move in legal_moves)
+                return chess.Move.from_uci("g1f3")
 
-        strategy = DummyStrategy(search_time=1.0)
+        client = _make_client(MoveStrategy(search_time=1.0))
+        client.player_color = "white"
+        with patch.object(client, "send_message") as send_message:
+            self.assertEqual(asyncio.run(client._play_one_move(0)), 1)
+        self.assertEqual(send_message.call_args[0][0]["data"]["move"], "Nf3")
+
+    def test_load_strategy_from_file_reuses_unchanged_module(self):
+        """Test that loading the same unchanged strategy file twice executes it only once."""
+        from chess_arena_client.main import load_strategy_from_file
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            strategy_path = os.path.join(tmp_dir, "my_strategy.py")
+            with open(strategy_path, "w") as f:
+                f.write("from chess_arena_client.strategy_base import StrategyBase\n"
+                        "class Strategy(StrategyBase):\n"
+                        "    def choose_move(self, board, legal_moves, player_color):\n"
+                        "        return legal_moves[0]\n")
+
+            first = load_strategy_from_file(strategy_path, search_time=1.0)
+            second = load_strategy_from_file(strategy_path, search_time=2.0)
+
+        self.assertIs(type(first), type(second))
+        self.assertEqual(second.search_time, 2.0)
+
+    def test_transposition_table_round_trip(self):
+        """Test that the client saves the strategy's table and restores it before warmup."""
+        class CachingStrategy(DummyStrategy):
+            table = b""
+
+            def get_transposition_table(self):
+                return b"cached positions"
+
+            def set_transposition_table(self, data):
+                self.table = data
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tt_path = os.path.join(tmp_dir, "strategy.tt")
+            client = _make_client(CachingStrategy(search_time=1.0), tt_file=tt_path)
+            # Nothing saved yet: restoring is a no-op
+            client._prepare_strategy()
+            self.assertEqual(client.strategy.table, b"")
+
+            client._save_transposition_table()
+            client._prepare_strategy()
+            self.assertEqual(client.strategy.table, b"cached positions")
+
+    def test_plain_console_strips_markup(self):
+        """Test that the non-terminal console writes plain text without styles."""
+        import io
+
+        from rich.text import Text
+
+        from chess_arena_client.main import _PlainConsole
+
+        output = io.StringIO()
+        plain_console = _PlainConsole(file=output)
+        plain_console.print("[red]✗ Error:[/red] bad move")
+        plain_console.print(Text("styled", style="bold"), "[literal]", markup=False)
+        self.assertEqual(output.getvalue(), "✗ Error: bad move\nstyled [literal]\n")
+
+    def test_main_uses_plain_console_for_strategy_output(self):
+        """Test that piped output swaps the built-in strategy's console for the plain one too."""
+        import chess_arena_client.main as main_module
+        import chess_arena_client.strategy as strategy_module
+        from chess_arena_client.main import _PlainConsole
+
+        with patch.object(sys, "argv", ["chess-arena-client"]), \
+                patch.object(sys.stdout, "isatty", return_value=False), \
+                patch.object(main_module, "console", main_module.console), \
+                patch.object(strategy_module, "console", strategy_module.console), \
+                patch.object(main_module, "ChessClient"), \
+                patch.object(main_module, "run_event_loop"):
+            main_module.main()
+            self.assertIsInstance(main_module.console, _PlainConsole)
+            self.assertIs(strategy_module.console, main_module.console)
+
+    def test_status_handlers_flush_plain_output(self):
+        """Test that game_over, error and opponent_disconnected output is flushed straight away."""
+        client = _make_client()
+        client.player_id = "p1"
+        messages = [
+            (client._on_game_over, {"type": "game_over", "status": "forfeit", "winner": "p1"}),
+            (client._on_error, {"type": "error", "message": "bad move"}),
+            (client._on_opponent_disconnected, {"type": "opponent_disconnected"}),
+        ]
+        for handler, msg in messages:
+            with patch("chess_arena_client.main.console") as console, \
+                    patch.object(client, "update_game_results"):
+                asyncio.run(handler(msg))
+            console.file.flush.assert_called_once()
+
+    def test_move_made_applies_move_and_checks_fen(self):
+        """Test that move_made pushes the move and falls back to the FEN when they disagree."""
+        client = _make_client()
+        client.player_color = "white"
+        after_e4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+        asyncio.run(client._on_move_made({"type": "move_made", "move": "e4", "fen": after_e4}))
+        self.assertEqual(client.local_board.fen(), after_e4)
+        self.assertEqual(len(client.local_board.move_stack), 1)
 
-        # Test with aggressive reconnect disabled (default)
-        client_normal = ChessClient(
-            server_url="http://localhost:9002",
-            strategy=strategy
-        )
-        self.assertFalse(client_normal.aggressive_reconnect)
-
-        # Test with aggressive reconnect enabled
-        client_aggressive = ChessClient(
-            server_url="http://localhost:9002",
-            strategy=strategy,
-            aggressive_reconnect=True
-        )
-        self.assertTrue(client_aggressive.aggressive_reconnect)
+        # An out-of-sync move is replaced by the server's position
+        after_d5 = "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"
+        with patch.object(client, "_play_one_move", return_value=1):
+            asyncio.run(client._on_move_made({"type": "move_made", "move": "Nf3", "fen": after_d5}))
+        self.assertEqual(client.local_board.fen(), after_d5)
 
 
 if __name__ == '__main__':
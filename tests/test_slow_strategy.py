@@ -11,6 +11,9 @@ import chess
 
 from chess_arena_client.strategy_base import StrategyBase
 
+# Private generator for picking moves, independent of the global random state
+_rng = random.Random()
+
 
 class Strategy(StrategyBase):
     """
@@ -18,8 +21,9 @@ class Strategy(StrategyBase):
     """
 
     def choose_move(self, board: chess.Board, legal_moves: List[str], player_color: str) -> str:
-        # Sleep for longer than the search time to trigger timeout
-        time.sleep(self.search_time + 0.5)
+        # Sleep just past the tester's timeout threshold (search time + 0.1s); time.sleep
+        # never returns early, so a 0.1s margin is enough to trigger the timeout
+        time.sleep(self.search_time + 0.2)
 
         # Return a valid move
-        return random.choice(legal_moves)
+        return _rng.choice(legal_moves)
@@ -4,23 +4,21 @@ Unit tests for the chess arena client strategy module.
 """
 
 import os
+import subprocess
 import sys
+import threading
+import time
 import unittest
+from unittest.mock import patch
+
+import chess
 
 # Add the project root to the path so we can import the module
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-# Change to the project directory so relative imports work
-original_cwd = os.getcwd()
-os.chdir(project_root)
-
-try:
-    import chess
-
-    from chess_arena_client.strategy import Strategy
-finally:
-    os.chdir(original_cwd)
+from chess_arena_client.strategy import (TIME_CHECK_MASK, TT_EXACT, TT_UPPER, EvalBoard, Strategy,  # noqa: E402
+                                         has_non_pawn_material, material_score, position_key)
 
 
 class TestStrategy(unittest.TestCase):
@@ -46,6 +44,37 @@ class TestStrategy(unittest.TestCase):
         # Should be close to 0 for equal material
         self.assertEqual(score, 0)
 
+    def test_evaluate_position_mirror_symmetric(self):
+        """Test that a colour-mirrored position evaluates to the negated score."""
+        board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 2 8")
+        board.remove_piece_at(chess.D8)
+        score = self.strategy.evaluate_position(board)
+        self.assertGreater(score, 800)
+        self.assertEqual(self.strategy.evaluate_position(board.mirror()), -score)
+
+    def test_evaluate_position_cached(self):
+        """Test that a repeated position is answered from the evaluation cache."""
+        board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 2 8")
+        score = self.strategy.evaluate_position(board)
+        self.assertEqual(self.strategy.eval_cache[position_key(board)], score)
+
+        with patch.object(chess.Board, "is_checkmate", side_effect=AssertionError("not cached")):
+            self.assertEqual(self.strategy.evaluate_position(board.copy()), score)
+
+    def test_eval_board_tracks_score_through_push_and_pop(self):
+        """Test that the incremental score matches a full recount, special moves included."""
+        board = EvalBoard("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+        self.assertEqual(board.score, material_score(board))
+        for uci in ["e5d6", "e8g8", "b7a8q", "f8a8", "e1c1"]:  # en passant, castling, promotion
+            board.push(chess.Move.from_uci(uci))
+            self.assertEqual(board.score, material_score(board))
+            self.assertEqual(self.strategy.evaluate_position(board), material_score(board))
+        board.push(chess.Move.null())
+        self.assertEqual(board.score, material_score(board))
+        while board.move_stack:
+            board.pop()
+            self.assertEqual(board.score, material_score(board))
+
     def test_choose_move_single_legal_move(self):
         """Test choosing a move when only one legal move is available."""
         board = chess.Board("8/8/8/8/8/8/8/K1k5 w - - 0 1")
@@ -53,6 +82,29 @@ class TestStrategy(unittest.TestCase):
         chosen_move = self.strategy.choose_move(board, legal_moves, "white")
         self.assertEqual(chosen_move, "Kb1")
 
+    def test_choose_move_discards_depth_aborted_during_research(self):
+        """Test that a depth aborted while re-searching outside the aspiration window is discarded."""
+        strategy = Strategy(search_time=10.0, workers=1)
+        board = chess.Board()
+        legal_moves = [board.san(move) for move in board.legal_moves]
+
+        def fake_minimax(search_board, depth, alpha, beta, maximizing, start_time):
+            if depth == 1:
+                return 30, chess.Move.from_uci("e2e4")
+            if alpha > -1000000 and beta < 1000000:
+                # Fail high on the narrow window, forcing a re-search
+                return beta, chess.Move.from_uci("g1f3")
+            strategy.search_aborted = True
+            return 20000, chess.Move.from_uci("g1h3")
+
+        with patch.object(strategy, "minimax", side_effect=fake_minimax), \
+                patch("chess_arena_client.strategy.console") as console:
+            move = strategy.choose_move(board, legal_moves, "white")
+        printed = " ".join(str(call.args[0]) for call in console.print.call_args_list)
+        self.assertEqual(move, "e4")
+        self.assertNotIn("Depth 2", printed)
+        self.assertNotIn("decisive", printed)
+
     def test_order_moves_captures_first(self):
         """Test that captures are ordered first."""
         board = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
@@ -70,6 +122,92 @@ class TestStrategy(unittest.TestCase):
                     # But this is acceptable since we're just testing ordering logic
                     break
 
+    def test_transposition_table_packs_entries(self):
+        """Test that stored entries come back unchanged from the packed table."""
+        promotion = chess.Move.from_uci("b7a8n")
+        self.strategy._store(12345, 7, -1000000, -50, 50, promotion)
+        self.assertEqual(self.strategy._probe(12345), (7, -1000000, TT_UPPER, promotion))
+        self.strategy._store(-98765, 3, 42, -50, 50, None)
+        self.assertEqual(self.strategy._probe(-98765), (3, 42, TT_EXACT, None))
+
+        # A shallower result does not replace a deeper one for the same position
+        self.strategy._store(12345, 2, 900, -50, 50, None)
+        self.assertEqual(self.strategy._probe(12345)[0], 7)
+        self.assertIsNone(self.strategy._probe(12346))
+
+    def test_order_moves_hash_move_first(self):
+        """Test that the transposition table move is ordered before captures."""
+        board = chess.Board("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2")
+        quiet_move = chess.Move.from_uci("g1f3")
+        ordered_moves = self.strategy._order_moves(board, list(board.legal_moves), quiet_move)
+        self.assertEqual(ordered_moves[0], quiet_move)
+        self.assertTrue(board.is_capture(ordered_moves[1]))
+        self.assertEqual(len(ordered_moves), board.legal_moves.count())
+
+    def test_order_moves_mvv_lva(self):
+        """Test that captures of more valuable pieces are tried first."""
+        # White pawn on d4 can take the queen on e5 or the knight on c5
+        board = chess.Board("4k3/8/8/2n1q3/3P4/8/8/7K w - - 0 1")
+        ordered_moves = self.strategy._order_moves(board, list(board.legal_moves))
+        self.assertEqual(ordered_moves[:2], [chess.Move.from_uci("d4e5"), chess.Move.from_uci("d4c5")])
+
+    def test_order_moves_killers_after_captures(self):
+        """Test that a quiet move which caused a cutoff is ordered right after captures."""
+        board = chess.Board("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2")
+        killer = chess.Move.from_uci("a2a3")
+        self.strategy._record_cutoff(board, killer, depth=3, ply=2)
+        self.assertEqual(self.strategy.history[killer.from_square][killer.to_square], 9)
+
+        ordered_moves = self.strategy._order_moves(board, list(board.legal_moves), ply=2)
+        self.assertEqual(ordered_moves[:2], [chess.Move.from_uci("e4d5"), killer])
+
+    def test_iter_moves_yields_each_legal_move_once(self):
+        """Test that staged move generation covers all legal moves, hash move and captures first."""
+        # White can capture en passant (e5d6), which lands on an empty square
+        board = chess.Board("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 3")
+        tt_move = chess.Move.from_uci("g1f3")
+        moves = list(self.strategy._iter_moves(board, tt_move))
+        self.assertCountEqual(moves, board.legal_moves)
+        self.assertEqual(moves[:2], [tt_move, chess.Move.from_uci("e5d6")])
+
+        # Both castling moves are legal; one is also the hash move and must not repeat
+        board = chess.Board("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        tt_move = chess.Move.from_uci("e1g1")
+        moves = list(self.strategy._iter_moves(board, tt_move))
+        self.assertCountEqual(moves, board.legal_moves)
+        self.assertEqual(moves[0], tt_move)
+        self.assertIn(chess.Move.from_uci("e1c1"), moves)
+
+    def test_minimax_stops_when_time_is_up(self):
+        """Test that the periodic time check aborts the search."""
+        self.strategy.search_time = 0.0
+        self.strategy.nodes_searched = TIME_CHECK_MASK
+        score, move = self.strategy.minimax(chess.Board(), 3, -1000000, 1000000, True, time.perf_counter())
+        self.assertTrue(self.strategy.search_aborted)
+        self.assertIsNone(move)
+
+    def test_minimax_aborted_midway_returns_no_root_move(self):
+        """Test that a root search cut short partway through returns no move."""
+        self.strategy.search_time = 0.0
+        self.strategy.nodes_searched = 0
+        score, move = self.strategy.minimax(chess.Board(), 3, -1000000, 1000000, True, time.perf_counter())
+        self.assertTrue(self.strategy.search_aborted)
+        self.assertGreater(self.strategy.nodes_searched, TIME_CHECK_MASK)
+        self.assertIsNone(move)
+
+    def test_stop_ends_running_search(self):
+        """Test that stop() from another thread ends a long search promptly with a legal move."""
+        board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 2 8")
+        legal_moves = [board.san(move) for move in board.legal_moves]
+        self.strategy.search_time = 300.0
+        timer = threading.Timer(0.2, self.strategy.stop)
+        timer.start()
+        start = time.perf_counter()
+        move = self.strategy.choose_move(board, legal_moves, "white")
+        timer.join()
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertIn(move, legal_moves)
+
     def test_minimax_base_case(self):
         """Test minimax base case at depth 0."""
         board = chess.Board()
@@ -78,6 +216,77 @@ class TestStrategy(unittest.TestCase):
         self.assertEqual(score, expected_score)
         self.assertIsNone(move)
 
+    def test_minimax_transposition_table(self):
+        """Test that searches are stored in the transposition table and reused."""
+        board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+        self.strategy.search_time = 1000.0
+        score, move = self.strategy.minimax(board, 2, -1000000, 1000000, True, time.perf_counter())
+        self.assertIsNotNone(self.strategy._probe(position_key(board)))
+
+        # The same search is now answered from the table
+        self.strategy.nodes_searched = 0
+        self.assertEqual(self.strategy.minimax(board, 2, -1000000, 1000000, True, time.perf_counter()), (score, move))
+        self.assertEqual(self.strategy.nodes_searched, 1)
+        self.assertEqual(move, chess.Move.from_uci("h5f7"))
+
+    def test_transposition_table_save_and_restore(self):
+        """Test that a saved table is probed by a new strategy, with keys stable across processes."""
+        board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+        self.strategy.search_time = 1000.0
+        self.strategy.minimax(board, 2, -1000000, 1000000, True, time.perf_counter())
+        data = self.strategy.get_transposition_table()
+
+        restored = Strategy(search_time=1.0)
+        restored.set_transposition_table(data)
+        self.assertEqual(restored._probe(position_key(board)), self.strategy._probe(position_key(board)))
+
+        # A table of the wrong size is ignored
+        restored.set_transposition_table(b"\0" * 16)
+        self.assertIsNotNone(restored._probe(position_key(board)))
+
+        # The next game runs in a new process, which must compute the same key
+        output = subprocess.run(
+            [sys.executable, "-c", "import chess; from chess_arena_client.strategy import position_key; "
+             f"print(position_key(chess.Board({board.fen()!r})))"],
+            cwd=project_root, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(int(output), position_key(board))
+
+    def test_search_root_parallel_matches_single_process(self):
+        """Test that splitting the root moves over worker processes finds the same best move."""
+        board = EvalBoard("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+        strategy = Strategy(search_time=30.0, workers=2)
+        try:
+            score, move = strategy._search_root_parallel(board, 2, -1000000, 1000000, True, time.perf_counter())
+        finally:
+            if strategy._pool is not None:
+                strategy._pool.shutdown()
+        self.assertEqual(move, chess.Move.from_uci("h5f7"))
+        self.assertEqual((score, move), self.strategy.minimax(board, 2, -1000000, 1000000, True, time.perf_counter()))
+        self.assertEqual(board.fen(), "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+
+    def test_minimax_quiescence_sees_recapture(self):
+        """Test that a depth-1 search does not grab a pawn defended by another pawn."""
+        board = chess.Board("4k3/8/3p4/4p3/8/8/8/4QK2 w - - 0 1")
+        self.strategy.search_time = 1000.0
+        _, move = self.strategy.minimax(board, 1, -1000000, 1000000, True, time.perf_counter())
+        self.assertNotEqual(move, chess.Move.from_uci("e1e5"))
+
+    def test_has_non_pawn_material(self):
+        """Test the zugzwang guard for null-move pruning."""
+        self.assertTrue(has_non_pawn_material(chess.Board()))
+        # King and pawns only for the side to move
+        self.assertFalse(has_non_pawn_material(chess.Board("4k3/4p3/8/8/8/8/4P3/3QK3 b - - 0 1")))
+
+    def test_can_reduce_late_quiet_moves_only(self):
+        """Test that only late quiet moves at sufficient depth are reduced"""
+        board = chess.Board("4k3/8/8/2n1q3/3P4/8/8/7K w - - 0 1")
+        quiet = chess.Move.from_uci("h1g1")
+        capture = chess.Move.from_uci("d4c5")
+        self.assertTrue(Strategy._can_reduce(board, quiet, 3, 3))
+        self.assertFalse(Strategy._can_reduce(board, quiet, 2, 3))
+        self.assertFalse(Strategy._can_reduce(board, quiet, 3, 2))
+        self.assertFalse(Strategy._can_reduce(board, capture, 3, 3))
+
 
 if __name__ == '__main__':
     unittest.main()
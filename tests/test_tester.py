@@ -3,23 +3,17 @@
 Unit tests for the chess arena client tester module.
 """
 
+import io
 import os
 import sys
 import unittest
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
 # Add the project root to the path so we can import the module
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-# Change to the project directory so relative imports work
-original_cwd = os.getcwd()
-os.chdir(project_root)
-
-try:
-    from chess_arena_client.tester import load_test_data, run_test_case
-finally:
-    os.chdir(original_cwd)
+from chess_arena_client.tester import load_test_data, run_test_case, sample_test_data  # noqa: E402
 
 
 class TestTester(unittest.TestCase):
@@ -29,15 +23,13 @@ class TestTester(unittest.TestCase):
         """Test successful loading of test data."""
         # Create mock JSONL content
         mock_content = (
-            '{"fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", '
-            '"legal_moves": ["e4", "d4"], "player_color": "white"}\n'
-        )
-        mock_content += (
-            '{"fen": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1", '
-            '"legal_moves": ["e5", "d5"], "player_color": "black"}\n'
+            b'{"fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", '
+            b'"legal_moves": ["e4", "d4"], "player_color": "white"}\n'
+            b'{"fen": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1", '
+            b'"legal_moves": ["e5", "d5"], "player_color": "black"}\n'
         )
 
-        with patch("builtins.open", mock_open(read_data=mock_content)):
+        with patch("builtins.open", return_value=io.BytesIO(mock_content)):
             test_cases = load_test_data("fake_path.jsonl")
             self.assertEqual(len(test_cases), 2)
             self.assertEqual(test_cases[0]["fen"], "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
@@ -48,19 +40,34 @@ class TestTester(unittest.TestCase):
         """Test loading test data with empty lines."""
         # Create mock JSONL content with empty lines
         mock_content = (
-            '{"fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", '
-            '"legal_moves": ["e4", "d4"], "player_color": "white"}\n'
-        )
-        mock_content += '\n'  # Empty line
-        mock_content += (
-            '{"fen": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1", '
-            '"legal_moves": ["e5", "d5"], "player_color": "black"}\n'
+            b'{"fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", '
+            b'"legal_moves": ["e4", "d4"], "player_color": "white"}\n'
+            b'\n'  # Empty line
+            b'{"fen": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1", '
+            b'"legal_moves": ["e5", "d5"], "player_color": "black"}\n'
         )
 
-        with patch("builtins.open", mock_open(read_data=mock_content)):
+        with patch("builtins.open", return_value=io.BytesIO(mock_content)):
             test_cases = load_test_data("fake_path.jsonl")
             self.assertEqual(len(test_cases), 2)  # Empty line should be skipped
 
+    def test_sample_test_data(self):
+        """Test sampling test data while reading counts every case but keeps only the sample."""
+        mock_content = b"".join(
+            b'{"fen": "8/8/8/8/8/8/8/K1k5 w - - 0 1", "legal_moves": ["Ka2"], "player_color": "white", "id": %d}\n' % i
+            for i in range(10)
+        )
+
+        with patch("builtins.open", return_value=io.BytesIO(mock_content)):
+            test_cases, total = sample_test_data("fake_path.jsonl", 3)
+        self.assertEqual(total, 10)
+        self.assertEqual(len(test_cases), 3)
+        self.assertEqual(len({test_case["id"] for test_case in test_cases}), 3)
+
+        with patch("builtins.open", return_value=io.BytesIO(mock_content)):
+            test_cases, total = sample_test_data("fake_path.jsonl", 20)
+        self.assertEqual([test_case["id"] for test_case in test_cases], list(range(10)))
+
     def test_run_test_case_success(self):
         """Test successful execution of a test case."""
         # Create a mock strategy
@@ -97,6 +104,43 @@ class TestTester(unittest.TestCase):
         test_passed, timeout_occurred = run_test_case(mock_strategy, test_case, 1, 0, 1, 0)
         self.assertFalse(test_passed)
 
+    def test_run_test_case_uci_notation(self):
+        """Test that strategies using UCI notation receive and return UCI moves."""
+        mock_strategy = Mock()
+        mock_strategy.move_notation = "uci"
+        mock_strategy.choose_move.return_value = "e2e4"
+        mock_strategy.search_time = 5.0
+
+        test_case = {
+            "fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+            "legal_moves": ["e4", "d4"],
+            "player_color": "white"
+        }
+
+        test_passed, timeout_occurred = run_test_case(mock_strategy, test_case, 1, 0, 1, 0)
+        self.assertTrue(test_passed)
+        self.assertEqual(mock_strategy.choose_move.call_args[0][1], ["e2e4", "d2d4"])
+
+    def test_run_test_case_board_isolated(self):
+        """Test that a strategy mutating its board does not affect later cases with the same FEN."""
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        boards = []
+
+        def choose_move(board, legal_moves, player_color):
+            boards.append(board.fen())
+            board.push_san("e4")
+            return "e4"
+
+        mock_strategy = Mock()
+        mock_strategy.choose_move.side_effect = choose_move
+        mock_strategy.search_time = 5.0
+
+        test_case = {"fen": fen, "legal_moves": ["e4", "d4"], "player_color": "white"}
+
+        run_test_case(mock_strategy, test_case, 1, 0, 2, 0)
+        run_test_case(mock_strategy, test_case, 2, 1, 2, 0)
+        self.assertEqual(boards, [fen, fen])
+
     def test_run_test_case_exception(self):
         """Test execution of a test case that raises an exception."""
         # Create a mock strategy that raises an exception